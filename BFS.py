@@ -1,22 +1,27 @@
-import pygame
-from pygame.math import Vector2
+from geometry import Vector2
 from constants import *
 from collections import deque
 
+def is_walkable(row : int, col : int):
+    if 0 <= row < len(TILE_MAP) and 0 <= col < len(TILE_MAP[row]):
+        return TILE_MAP[row][col] != 'W'
+    return False
+
 def finding_a_way(starting_pos : Vector2, finishing_pos : Vector2):
     starting_pos = (int(starting_pos.y // TILE_SIZE), int(starting_pos.x // TILE_SIZE))
     finishing_pos = (int(finishing_pos.y // TILE_SIZE), int(finishing_pos.x // TILE_SIZE))
     queue = deque([starting_pos])
     queue_visits = {starting_pos : None}
     directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    map_height_tiles, map_width_tiles = len(TILE_MAP), len(TILE_MAP[0])
     while queue:
         current_pos = queue.popleft()
         if current_pos == finishing_pos:
             return reconstruct_path(queue_visits, starting_pos, finishing_pos)
         for x, y in directions:
             neighbor_pos = (current_pos[0] + x, current_pos[1] + y)
-            if 0 <= neighbor_pos[0] < MAP_HEIGHT_TILES and \
-                0 <= neighbor_pos[1] < MAP_WIDTH_TILES:
+            if 0 <= neighbor_pos[0] < map_height_tiles and \
+                0 <= neighbor_pos[1] < map_width_tiles:
                 if TILE_MAP[neighbor_pos[0]][neighbor_pos[1]] != 'W' and neighbor_pos not in queue_visits:
                     queue.append(neighbor_pos)
                     queue_visits[neighbor_pos] = current_pos
@@ -30,4 +35,80 @@ def reconstruct_path(queue_visits: dict, starting_pos: tuple[int, int], finishin
             return deque()
         path.append(current)
         current = queue_visits[current]
-    return deque(path[::-1])
\ No newline at end of file
+    return deque(path[::-1])
+
+def tile_center(tile : tuple[int, int]):
+    return Vector2(tile[1] * TILE_SIZE + TILE_SIZE / 2, tile[0] * TILE_SIZE + TILE_SIZE / 2)
+
+def is_segment_clear(x0 : float, y0 : float, x1 : float, y1 : float):
+    # Supercover traversal: every tile the segment touches is visited,
+    # including both neighbours when it passes exactly through a tile corner.
+    col, row = int(x0 // TILE_SIZE), int(y0 // TILE_SIZE)
+    if not is_walkable(row, col):
+        return False
+    dx, dy = x1 - x0, y1 - y0
+    step_x = 1 if dx > 0 else -1 if dx < 0 else 0
+    step_y = 1 if dy > 0 else -1 if dy < 0 else 0
+    t_delta_x = TILE_SIZE / abs(dx) if dx else float('inf')
+    t_delta_y = TILE_SIZE / abs(dy) if dy else float('inf')
+    if dx > 0:
+        t_max_x = ((col + 1) * TILE_SIZE - x0) / dx
+    elif dx < 0:
+        t_max_x = (x0 - col * TILE_SIZE) / -dx
+    else:
+        t_max_x = float('inf')
+    if dy > 0:
+        t_max_y = ((row + 1) * TILE_SIZE - y0) / dy
+    elif dy < 0:
+        t_max_y = (y0 - row * TILE_SIZE) / -dy
+    else:
+        t_max_y = float('inf')
+    while min(t_max_x, t_max_y) < 1.0:
+        if t_max_x < t_max_y:
+            col += step_x
+            t_max_x += t_delta_x
+        elif t_max_y < t_max_x:
+            row += step_y
+            t_max_y += t_delta_y
+        else:
+            if not is_walkable(row, col + step_x) or not is_walkable(row + step_y, col):
+                return False
+            col += step_x
+            row += step_y
+            t_max_x += t_delta_x
+            t_max_y += t_delta_y
+        if not is_walkable(row, col):
+            return False
+    return True
+
+def has_line_of_sight(starting_pos : Vector2, finishing_pos : Vector2, clearance : float = 0.0):
+    # A square body of half-size `clearance` sweeps the hull of its corner
+    # trajectories, so testing the segment from each corner is enough when
+    # walls are at least as large as the body.
+    if not clearance:
+        return is_segment_clear(starting_pos.x, starting_pos.y, finishing_pos.x, finishing_pos.y)
+    for offset_x, offset_y in ((-clearance, -clearance), (clearance, -clearance),
+                               (-clearance, clearance), (clearance, clearance)):
+        if not is_segment_clear(starting_pos.x + offset_x, starting_pos.y + offset_y,
+                                finishing_pos.x + offset_x, finishing_pos.y + offset_y):
+            return False
+    return True
+
+def smoothing_path(starting_pos : Vector2, path : deque, clearance : float = 0.0):
+    # String pulling: keep only the waypoints where the straight line from
+    # the previous kept point would cut through a wall.
+    if len(path) < 2:
+        return path
+    smoothed_path = deque()
+    anchor_pos = starting_pos
+    ind_current = 0
+    while ind_current < len(path):
+        ind_farthest = ind_current
+        for ind_candidate in range(len(path) - 1, ind_current, -1):
+            if has_line_of_sight(anchor_pos, tile_center(path[ind_candidate]), clearance):
+                ind_farthest = ind_candidate
+                break
+        smoothed_path.append(path[ind_farthest])
+        anchor_pos = tile_center(path[ind_farthest])
+        ind_current = ind_farthest + 1
+    return smoothed_path
\ No newline at end of file
@@ -1,5 +1,4 @@
-import pygame
-from pygame import Vector2
+from geometry import Vector2
 from player import Player
 
 class Camera:
@@ -1,6 +1,7 @@
-import pygame
-from pygame.math import Vector2
+from geometry import Vector2, Rect
+from entity import Entity
 from state import State
+from timers import Timer, TimerScheduler
 from collections import deque
 from typing import TYPE_CHECKING
 
@@ -35,6 +36,11 @@ class DashComponent:
             return True
         return False
     
+    def stop_dashing(self, current_time : int):
+        self.is_dashing = False
+        self.last_dash_end_time = current_time
+        self.current_dash_direction = Vector2(0, 0)
+    
 class TensionBowstringComponent:
     def __init__(self, min_tension_duration, max_tension_duration):
         self.min_tension_duration = min_tension_duration
@@ -90,10 +96,13 @@ class TensionBowstringComponent:
                     return 0.0
         return 0.0
     
-class SwordComponent(pygame.sprite.Sprite):
+class SwordComponent(Entity):
     def __init__(self, sword_strike_cooldown : int, sword_strike_damage : int, sword_strike_radius : int,
-                 sword_time_swing : int, sword_time_strike : int, owner_sword : 'Enemy', purpose_strike : 'Player'):
+                 sword_time_swing : int, sword_time_strike : int, owner_sword : 'Enemy', purpose_strike : 'Player',
+                 timers : TimerScheduler):
         super().__init__()
+        self.timers = timers
+        self.state_timer : Timer | None = None
         self.sword_strike_cooldown = sword_strike_cooldown
         self.sword_strike_damage = sword_strike_damage
         self.sword_strike_radius = sword_strike_radius
@@ -105,43 +114,46 @@ class SwordComponent(pygame.sprite.Sprite):
         self.pos = owner_sword.pos
         self.owner_sword = owner_sword
         self.purpose_strike = purpose_strike
-        self.image = pygame.Surface([30, 30])
-        self.image.fill("green")
-        self.rect = self.image.get_rect(center=self.owner_sword.pos)
+        self.color = "green"
+        self.image_size = (30, 30)
+        self.rect = Rect.from_center(self.owner_sword.pos, 30, 30)
         self.current_state_obj = SwordIdleState(self)
         self.current_state_obj.enter()
         
     def change_state(self, new_state : State):
+        if self.state_timer is not None:
+            self.state_timer.cancel()
+            self.state_timer = None
         if self.current_state_obj:
             self.current_state_obj.exit()
         self.current_state_obj = new_state
         self.current_state_obj.enter()
         
+    def change_state_at(self, fire_time : int, state_class : type):
+        # The sword sleeps in its current state until the timer switches it.
+        self.state_timer = self.timers.schedule(fire_time, lambda current_time: self.change_state(state_class(self)))
+        
+    def kill(self):
+        if self.state_timer is not None:
+            self.state_timer.cancel()
+            self.state_timer = None
+        super().kill()
+        
     def try_swing(self, current_time : int):
-        if not self.sword_is_strike and current_time - self.sword_last_time_strike >= \
-            self.sword_time_swing + self.sword_time_strike + self.sword_strike_cooldown:
-                self.sword_is_strike = True
-                self.sword_last_time_strike = current_time
-                return True
-        return False
-    
-    def try_strike(self, current_time : int):
-        if current_time - self.sword_last_time_strike >= self.sword_time_swing:
+        if not self.sword_is_strike and current_time >= self.get_idle_time():
+            self.sword_is_strike = True
+            self.sword_last_time_strike = current_time
             return True
         return False
     
-    def try_cooldown(self, current_time : int):
-        if current_time - self.sword_last_time_strike >= \
-            self.sword_time_swing + self.sword_time_strike:
-                self.sword_is_strike = False
-                return True
-        return False
+    def get_strike_time(self):
+        return self.sword_last_time_strike + self.sword_time_swing
     
-    def try_idle(self, current_time : int):
-        if current_time - self.sword_last_time_strike >= \
-            self.sword_time_swing + self.sword_time_strike + self.sword_strike_cooldown:
-                return True
-        return False
+    def get_cooldown_time(self):
+        return self.sword_last_time_strike + self.sword_time_swing + self.sword_time_strike
+    
+    def get_idle_time(self):
+        return self.sword_last_time_strike + self.sword_time_swing + self.sword_time_strike + self.sword_strike_cooldown
     
     def start_swing(self, current_time : int):
         if isinstance(self.current_state_obj, SwordIdleState):
@@ -164,15 +176,16 @@ class SwordSwingState(State['SwordComponent']):
     def __init__(self, swordcomponent : 'SwordComponent'):
         super().__init__(swordcomponent)
         
-    def update(self, current_time : int, game_events_queue : deque):
-        if self.context.try_strike(current_time):
-            return SwordStrikeState(self.context)
-        return None
+    def enter(self):
+        self.context.change_state_at(self.context.get_strike_time(), SwordStrikeState)
         
 class SwordStrikeState(State['SwordComponent']):
     def __init__(self, swordcomponent : 'SwordComponent'):
         super().__init__(swordcomponent)
         
+    def enter(self):
+        self.context.change_state_at(self.context.get_cooldown_time(), SwordCooldownState)
+        
     def update(self, current_time : int, game_events_queue : deque):
         if not self.context.sword_is_touch:
             direction = Vector2(0, 0)
@@ -187,8 +200,6 @@ class SwordStrikeState(State['SwordComponent']):
                     'targets' : [self.context.purpose_strike],
                     'amount_damage' : self.context.sword_strike_damage
                 })
-        if self.context.try_cooldown(current_time):
-            return SwordCooldownState(self.context)
         return None
         
 class SwordCooldownState(State['SwordComponent']):
@@ -196,9 +207,6 @@ class SwordCooldownState(State['SwordComponent']):
         super().__init__(swordcomponent)
         
     def enter(self):
+        self.context.sword_is_strike = False
         self.context.sword_is_touch = False
-        
-    def update(self, current_time : int, game_events_queue : deque):
-        if self.context.try_idle(current_time):
-            return SwordIdleState(self.context)
-        return None
\ No newline at end of file
+        self.context.change_state_at(self.context.get_idle_time(), SwordIdleState)
\ No newline at end of file
@@ -11,12 +11,20 @@ PLAYER_MIN_TENSION_DURATION = 400
 PLAYER_MAX_TENSION_DURATION = 2000
 ARROW_SPEED = 7
 ARROW_DAMAGE = 10
+ARROW_IMAGE_SIZE = (20, 5)
+ARROW_COLOR = (0, 0, 0)
+PROJECTILE_INITIAL_CAPACITY = 256
+PROJECTILE_HIT_TEST_CHUNK = 256
 ENEMY_SPEED = 0.7
 ENEMY_HEALTH = 100
 ENEMY_DETECTION_DISTANCE = 250
 ENEMY_SPRITE_WIDTH = 30
 ENEMY_SPRITE_HEIGHT = 30
 NUM_ENEMIES = 5
+ENEMY_SEPARATION_DISTANCE = 30
+ENEMY_SEPARATION_STRENGTH = 0.6
+ENEMY_LOD_TIERS = [(400, 1), (800, 3)]
+ENEMY_LOD_FAR_TICK_INTERVAL = 8
 SWORD_STRIKE_COOLDOWN = 1200
 SWORD_TIME_SWING = 800
 SWORD_TIME_STRIKE = 200
@@ -59,4 +67,23 @@ TILE_MAP = [
 MAP_WIDTH_TILES = len(TILE_MAP[0])
 MAP_HEIGHT_TILES = len(TILE_MAP)
 MAP_WIDTH_PX = MAP_WIDTH_TILES * TILE_SIZE
-MAP_HEIGHT_PX = MAP_HEIGHT_TILES * TILE_SIZE
\ No newline at end of file
+MAP_HEIGHT_PX = MAP_HEIGHT_TILES * TILE_SIZE
+NET_PORT = 47777
+NET_MAX_PLAYERS = 4
+NET_SNAPSHOT_INTERVAL = 2
+NET_SNAPSHOT_HISTORY = 64
+NET_RELEVANCE_DISTANCE = 700
+NET_MAX_SNAPSHOT_ENTITIES = 64
+NET_POSITION_QUANT = 4
+NET_INPUT_REDUNDANCY = 3
+NET_MAX_INPUTS_PER_TICK = 8
+NET_CLIENT_TIMEOUT = 5000
+NET_RECONCILE_TOLERANCE = 2
+NET_RECONCILE_SNAP_DISTANCE = 100
+RECORD_KEYFRAME_INTERVAL = 180
+RECORD_COMPRESSION_LEVEL = 6
+RECORD_SEEK_SECONDS = 5
+SCENARIO_DURATION = 10
+SCENARIO_WALL_DENSITY = 0.08
+SCENARIO_SPAWN_MIN_DISTANCE = 150
+SCENARIO_SPAWN_MAX_DISTANCE = 900
\ No newline at end of file
@@ -1,14 +1,16 @@
-import pygame
-from pygame.math import Vector2
+from geometry import Vector2, Rect
+from entity import Entity, EntityGroup
 from collections import deque
 from state import State
 from components import SwordComponent
-from BFS import finding_a_way
+from spatial_hash import SpatialHash
+from timers import TimerScheduler
+from world_objects import get_wall_collisions
+from BFS import finding_a_way, has_line_of_sight, smoothing_path, tile_center
 from constants import *
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
      from .player import Player
-     from .world_objects import Wall
 
 class EnemyIdleState(State['Enemy']):
     def __init__(self, enemy : 'Enemy'):
@@ -28,32 +30,47 @@ class EnemyAttackingState(State['Enemy']):
 
     def enter(self):
         self.recalc_interval = 1000 
-        self.last_recalc_time = 0
-        self.recalculate_path(pygame.time.get_ticks())
+        self.replan_timer = None
+        self.clearance = min(self.context.rect.width, self.context.rect.height) / 2 - 1
+        self.path = deque()
+        
+    def exit(self):
+        if self.replan_timer is not None:
+            self.replan_timer.cancel()
 
     def recalculate_path(self, current_time: int):
-        self.last_recalc_time = current_time
+        # Dropping the path when the timer fires makes the next update plan a new one.
+        if self.replan_timer is not None:
+            self.replan_timer.cancel()
+        self.replan_timer = self.context.timers.schedule(current_time + self.recalc_interval,
+                                                         lambda fire_time: self.path.clear())
         start_pos = Vector2(self.context.pos.x, self.context.pos.y)
         end_pos = Vector2(self.context.player.pos.x, self.context.player.pos.y)
-        self.path = finding_a_way(start_pos, end_pos)
+        self.path = smoothing_path(start_pos, finding_a_way(start_pos, end_pos), self.clearance)
 
     def update(self, current_time: int, game_events_queue: deque):
-        if not self.path or current_time - self.last_recalc_time > self.recalc_interval:
-            self.recalculate_path(current_time)
-        if self.path:
-            finishing_pixel_pos = Vector2(self.path[0][1] * TILE_SIZE + TILE_SIZE / 2, 
-                                       self.path[0][0] * TILE_SIZE + TILE_SIZE / 2)
-            if self.context.pos.distance_to(finishing_pixel_pos) < self.context.speed * 0.5:
-                self.path.popleft()
-                if self.path:
-                    finishing_pixel_pos = Vector2(self.path[0][1] * TILE_SIZE + TILE_SIZE / 2, 
-                                               self.path[0][0] * TILE_SIZE + TILE_SIZE / 2)
+        if has_line_of_sight(self.context.pos, self.context.player.pos, self.clearance):
+            self.path.clear()
+            finishing_pixel_pos = self.context.player.pos
             if self.context.pos.distance_to(finishing_pixel_pos) > 0:
                 move_direction = (finishing_pixel_pos - self.context.pos).normalize()
             else:
                 move_direction = Vector2(0, 0)
         else:
-            move_direction = Vector2(0, 0)
+            if not self.path:
+                self.recalculate_path(current_time)
+            if self.path:
+                finishing_pixel_pos = tile_center(self.path[0])
+                if self.context.pos.distance_to(finishing_pixel_pos) < self.context.speed * self.context.lod_step * 0.5:
+                    self.path.popleft()
+                    if self.path:
+                        finishing_pixel_pos = tile_center(self.path[0])
+                if self.context.pos.distance_to(finishing_pixel_pos) > 0:
+                    move_direction = (finishing_pixel_pos - self.context.pos).normalize()
+                else:
+                    move_direction = Vector2(0, 0)
+            else:
+                move_direction = Vector2(0, 0)
         self.context.velocity = move_direction * self.context.speed
         if self.context.pos.distance_to(self.context.player.pos) <= self.context.sword_strike_radius:
             self.context.sword_component.start_swing(current_time)
@@ -63,32 +80,39 @@ class EnemyDyingState(State['Enemy']):
     def __init__(self, enemy : 'Enemy'):
         super().__init__(enemy)
         
-    def update(self, current_time : int, game_events_queue : deque):
+    def enter(self):
+        # Removed at once: waiting for the next LOD tick would leave a far enemy
+        # absorbing arrows and showing up in snapshots for several frames.
         self.context.kill()
         self.context.sword_component.kill()
-        return None
             
-class Enemy(pygame.sprite.Sprite):
+class Enemy(Entity):
     def __init__(self, pos : Vector2, speed : int, health : int, width : int, height : int, sword_strike_cooldown : int,
                 sword_strike_damage : int, sword_strike_radius : int, sword_time_swing : int, sword_time_strike : int, 
-                detection_distance, all_sprites : pygame.sprite.Group, player : 'Player'):
+                detection_distance, all_sprites : EntityGroup, player : 'Player', timers : TimerScheduler,
+                separation_distance : int = ENEMY_SEPARATION_DISTANCE, separation_strength : float = ENEMY_SEPARATION_STRENGTH):
         super().__init__()
-        self.image = pygame.Surface([width, height])
-        self.image.fill("red")
-        self.rect = self.image.get_rect(center=pos)
+        self.color = "red"
+        self.image_size = (width, height)
+        self.rect = Rect.from_center(pos, width, height)
         self.pos = pos
         self.speed = speed
         self.health = health
         self.velocity = Vector2(0, 0)
+        self.lod_phase = 0
+        self.lod_step = 1
         self.detection_distance = detection_distance
+        self.separation_distance = separation_distance
+        self.separation_strength = separation_strength
         self.player = player
+        self.timers = timers
         self.sword_strike_cooldown = sword_strike_cooldown
         self.sword_strike_damage = sword_strike_damage
         self.sword_strike_radius = sword_strike_radius
         self.sword_time_swing = sword_time_swing
         self.sword_time_strike = sword_time_strike
         self.sword_component = SwordComponent(sword_strike_cooldown, sword_strike_damage,
-                                              sword_strike_radius, sword_time_swing, sword_time_strike, self, player)
+                                              sword_strike_radius, sword_time_swing, sword_time_strike, self, player, timers)
         all_sprites.add(self.sword_component)
         self.current_state_obj = EnemyIdleState(self)
         self.current_state_obj.enter()
@@ -104,33 +128,52 @@ class Enemy(pygame.sprite.Sprite):
         if self.health <= 0:
             self.change_state(EnemyDyingState(self))
                 
-    def update(self, game_events_queue : deque, current_time : int, walls : pygame.sprite.Group):
+    def get_separation_velocity(self, crowd : SpatialHash):
+        separation = Vector2(0, 0)
+        if not self.separation_distance:
+            return separation
+        for other in crowd.query(self.pos, self.separation_distance):
+            if other is self:
+                continue
+            offset = self.pos - other.pos
+            distance = offset.length()
+            if 0 < distance < self.separation_distance:
+                separation += offset * ((self.separation_distance - distance) / (self.separation_distance * distance))
+        return separation * self.speed * self.separation_strength
+                
+    def update(self, game_events_queue : deque, current_time : int,
+               crowd : SpatialHash = None, step : int = 1):
+        self.lod_step = step
         new_state = self.current_state_obj.update(current_time, game_events_queue)
         if new_state:
             self.change_state(new_state)
         
         self.sword_component.update(game_events_queue, current_time)
+        
+        move = Vector2(self.velocity)
+        if crowd is not None:
+            move += self.get_separation_velocity(crowd)
             
-        self.pos.x += self.velocity.x
+        self.pos.x += move.x * step
         self.rect.centerx = self.pos.x
         
-        x_collisions : list['Wall'] = pygame.sprite.spritecollide(self, walls, False)
-        for wall_hit in x_collisions:
-            if self.velocity.x > 0:
-                self.rect.right = wall_hit.rect.left
-            elif self.velocity.x < 0:
-                self.rect.left = wall_hit.rect.right
+        x_collisions : list[Rect] = get_wall_collisions(self.rect)
+        for wall_rect in x_collisions:
+            if move.x > 0:
+                self.rect.right = wall_rect.left
+            elif move.x < 0:
+                self.rect.left = wall_rect.right
             self.pos.x = self.rect.centerx
             self.velocity.x = 0
             
-        self.pos.y += self.velocity.y
+        self.pos.y += move.y * step
         self.rect.centery = self.pos.y
             
-        y_collisions : list['Wall'] = pygame.sprite.spritecollide(self, walls, False)
-        for wall_hit in y_collisions:
-            if self.velocity.y > 0:
-                self.rect.bottom = wall_hit.rect.top
-            elif self.velocity.y < 0:
-                self.rect.top = wall_hit.rect.bottom
+        y_collisions : list[Rect] = get_wall_collisions(self.rect)
+        for wall_rect in y_collisions:
+            if move.y > 0:
+                self.rect.bottom = wall_rect.top
+            elif move.y < 0:
+                self.rect.top = wall_rect.bottom
             self.pos.y = self.rect.centery
             self.velocity.y = 0
\ No newline at end of file
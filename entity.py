@@ -0,0 +1,61 @@
+import itertools
+
+_entity_ids = itertools.count(1)
+
+def allocate_entity_id():
+    # Ids are shared with non-entity objects such as batched projectiles.
+    return next(_entity_ids)
+
+class Entity:
+    # Plain replacement for pygame.sprite.Sprite: group membership and kill()/alive().
+    def __init__(self):
+        self._groups : set['EntityGroup'] = set()
+        self.entity_id = allocate_entity_id()
+
+    def add(self, *groups : 'EntityGroup'):
+        for group in groups:
+            group.add(self)
+
+    def kill(self):
+        for group in list(self._groups):
+            group.remove(self)
+
+    def alive(self):
+        return bool(self._groups)
+
+    def groups(self):
+        return list(self._groups)
+
+class EntityGroup:
+    def __init__(self, *entities : Entity):
+        self._entities : dict[Entity, None] = {}
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, *entities : Entity):
+        for entity in entities:
+            if entity not in self._entities:
+                self._entities[entity] = None
+                entity._groups.add(self)
+
+    def remove(self, *entities : Entity):
+        for entity in entities:
+            if entity in self._entities:
+                del self._entities[entity]
+                entity._groups.discard(self)
+
+    def sprites(self):
+        return list(self._entities)
+
+    def __iter__(self):
+        # Iterate over a snapshot so entities can be killed mid-loop, as with pygame groups.
+        return iter(list(self._entities))
+
+    def __len__(self):
+        return len(self._entities)
+
+    def __contains__(self, entity : Entity):
+        return entity in self._entities
+
+    def __bool__(self):
+        return bool(self._entities)
\ No newline at end of file
@@ -0,0 +1,205 @@
+import math
+
+class Vector2:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x=0.0, y=None):
+        if y is None:
+            if isinstance(x, (int, float)):
+                self.x = self.y = x
+            else:
+                self.x, self.y = x[0], x[1]
+        else:
+            self.x = x
+            self.y = y
+
+    def __repr__(self):
+        return f"Vector2({self.x}, {self.y})"
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, index : int):
+        return (self.x, self.y)[index]
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __eq__(self, other):
+        try:
+            return self.x == other[0] and self.y == other[1]
+        except (TypeError, IndexError):
+            return NotImplemented
+
+    def __add__(self, other):
+        return Vector2(self.x + other[0], self.y + other[1])
+
+    __radd__ = __add__
+
+    def __iadd__(self, other):
+        self.x += other[0]
+        self.y += other[1]
+        return self
+
+    def __sub__(self, other):
+        return Vector2(self.x - other[0], self.y - other[1])
+
+    def __rsub__(self, other):
+        return Vector2(other[0] - self.x, other[1] - self.y)
+
+    def __isub__(self, other):
+        self.x -= other[0]
+        self.y -= other[1]
+        return self
+
+    def __mul__(self, scalar : float):
+        return Vector2(self.x * scalar, self.y * scalar)
+
+    __rmul__ = __mul__
+
+    def __imul__(self, scalar : float):
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def __truediv__(self, scalar : float):
+        return Vector2(self.x / scalar, self.y / scalar)
+
+    def __itruediv__(self, scalar : float):
+        self.x /= scalar
+        self.y /= scalar
+        return self
+
+    def __neg__(self):
+        return Vector2(-self.x, -self.y)
+
+    def copy(self):
+        return Vector2(self.x, self.y)
+
+    def update(self, x, y=None):
+        if y is None:
+            self.x, self.y = x[0], x[1]
+        else:
+            self.x = x
+            self.y = y
+
+    def length(self):
+        return math.hypot(self.x, self.y)
+
+    def length_squared(self):
+        return self.x * self.x + self.y * self.y
+
+    def normalize(self):
+        length = math.hypot(self.x, self.y)
+        if not length:
+            raise ValueError("Can't normalize Vector of length Zero")
+        return Vector2(self.x / length, self.y / length)
+
+    def normalize_ip(self):
+        length = math.hypot(self.x, self.y)
+        if not length:
+            raise ValueError("Can't normalize Vector of length Zero")
+        self.x /= length
+        self.y /= length
+
+    def distance_to(self, other):
+        return math.hypot(self.x - other[0], self.y - other[1])
+
+    def distance_squared_to(self, other):
+        dx = self.x - other[0]
+        dy = self.y - other[1]
+        return dx * dx + dy * dy
+
+    def angle_to(self, other):
+        return math.degrees(math.atan2(other[1], other[0]) - math.atan2(self.y, self.x))
+
+class Rect:
+    # Integer rect with pygame.Rect semantics for the attributes the simulation uses.
+    __slots__ = ('x', 'y', 'width', 'height')
+
+    def __init__(self, x : int, y : int, width : int, height : int):
+        self.x = int(x)
+        self.y = int(y)
+        self.width = int(width)
+        self.height = int(height)
+
+    @classmethod
+    def from_center(cls, center, width : int, height : int):
+        return cls(round(center[0]) - width // 2, round(center[1]) - height // 2, width, height)
+
+    def __repr__(self):
+        return f"Rect({self.x}, {self.y}, {self.width}, {self.height})"
+
+    def copy(self):
+        return Rect(self.x, self.y, self.width, self.height)
+
+    @property
+    def left(self):
+        return self.x
+
+    @left.setter
+    def left(self, value : int):
+        self.x = round(value)
+
+    @property
+    def top(self):
+        return self.y
+
+    @top.setter
+    def top(self, value : int):
+        self.y = round(value)
+
+    @property
+    def right(self):
+        return self.x + self.width
+
+    @right.setter
+    def right(self, value : int):
+        self.x = round(value) - self.width
+
+    @property
+    def bottom(self):
+        return self.y + self.height
+
+    @bottom.setter
+    def bottom(self, value : int):
+        self.y = round(value) - self.height
+
+    @property
+    def centerx(self):
+        return self.x + self.width // 2
+
+    @centerx.setter
+    def centerx(self, value : float):
+        self.x = round(value) - self.width // 2
+
+    @property
+    def centery(self):
+        return self.y + self.height // 2
+
+    @centery.setter
+    def centery(self, value : float):
+        self.y = round(value) - self.height // 2
+
+    @property
+    def center(self):
+        return (self.x + self.width // 2, self.y + self.height // 2)
+
+    @center.setter
+    def center(self, value):
+        self.x = round(value[0]) - self.width // 2
+        self.y = round(value[1]) - self.height // 2
+
+    @property
+    def topleft(self):
+        return (self.x, self.y)
+
+    @property
+    def size(self):
+        return (self.width, self.height)
+
+    def colliderect(self, other : 'Rect'):
+        return self.width > 0 and self.height > 0 and other.width > 0 and other.height > 0 and \
+            self.x < other.x + other.width and other.x < self.x + self.width and \
+            self.y < other.y + other.height and other.y < self.y + self.height
\ No newline at end of file
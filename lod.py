@@ -0,0 +1,22 @@
+from geometry import Vector2
+
+class AILevelOfDetail:
+    def __init__(self, tiers : list[tuple[int, int]], far_tick_interval : int):
+        # tiers: (max distance in px, tick interval in frames), nearest first
+        self.tiers = [(max_distance * max_distance, tick_interval) for max_distance, tick_interval in tiers]
+        self.far_tick_interval = far_tick_interval
+
+    def get_tick_interval(self, pos : Vector2, focus_pos : Vector2):
+        distance_squared = pos.distance_squared_to(focus_pos)
+        for max_distance_squared, tick_interval in self.tiers:
+            if distance_squared <= max_distance_squared:
+                return tick_interval
+        return self.far_tick_interval
+
+    def get_step(self, pos : Vector2, focus_pos : Vector2, phase : int, frame_index : int):
+        # Number of frames to simulate this tick, or 0 if the entity sleeps this frame.
+        # The phase spreads entities of one tier across frames instead of bunching them.
+        tick_interval = self.get_tick_interval(pos, focus_pos)
+        if (frame_index + phase) % tick_interval == 0:
+            return tick_interval
+        return 0
\ No newline at end of file
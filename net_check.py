@@ -0,0 +1,101 @@
+import argparse
+import sys
+from geometry import Vector2
+from net_server import GameServer
+from net_client import GameClient
+from net_protocol import INPUT_BUTTONS, MAX_SNAPSHOT_SIZE
+from constants import *
+
+# Inputs the clients send before each server tick: bursts and empty ticks, as jitter would give.
+INPUTS_PER_TICK_PATTERN = [1, 2, 0, 1, 3, 0, 1]
+SETTLE_TICKS = NET_SNAPSHOT_INTERVAL * 4
+# Every this many ticks the first burst input presses the bow and the second releases it.
+CLICK_TICK_INTERVAL = len(INPUTS_PER_TICK_PATTERN) * 5
+
+def get_check_input(ind_client : int, ind_input : int, pressed : bool = False, released : bool = False):
+    # Each client walks its own route, changing direction every second of inputs.
+    routes = [['key_button_D_hold', 'key_button_S_hold', 'key_button_A_hold', 'key_button_W_hold'],
+              ['key_button_S_hold', 'key_button_D_hold', 'key_button_W_hold', 'key_button_A_hold']]
+    input_state = {button_name : False for button_name in INPUT_BUTTONS}
+    route = routes[ind_client % len(routes)]
+    input_state[route[ind_input // FPS % len(route)]] = True
+    input_state['mouse_button_left_pressed'] = pressed
+    input_state['mouse_button_left_released'] = released
+    input_state['mouse_pos_world'] = Vector2(0, 0)
+    return input_state
+
+def run_localhost_check(ticks : int = 600, client_count : int = 2):
+    server = GameServer('127.0.0.1', 0)
+    clients = [GameClient(server.address) for _ in range(client_count)]
+    frame_duration = 1000 // FPS
+    try:
+        input_counts = [0] * client_count
+        client_time = server_time = 0
+        clicks = lost_releases = 0
+        for ind_tick in range(ticks + SETTLE_TICKS):
+            inputs_this_tick = INPUTS_PER_TICK_PATTERN[ind_tick % len(INPUTS_PER_TICK_PATTERN)] if ind_tick < ticks else 0
+            click_tick = inputs_this_tick >= 2 and ind_tick % CLICK_TICK_INTERVAL == 1
+            for ind_input in range(inputs_this_tick):
+                client_time += frame_duration
+                for ind_client, client in enumerate(clients):
+                    input_state = get_check_input(ind_client, input_counts[ind_client],
+                                                  click_tick and ind_input == 0, click_tick and ind_input == 1)
+                    client.send_input(input_state, client_time)
+                    input_counts[ind_client] += 1
+            server_time += frame_duration
+            server.tick(server_time)
+            if click_tick:
+                clicks += 1
+                lost_releases += sum(type(connection.player.current_state_obj).__name__ == 'PlayerChargingBowState'
+                                     for connection in server.clients.values())
+            # Damage would end the run early; positions and packets are what is checked.
+            for connection in server.clients.values():
+                connection.player.health = PLAYER_HEALTH
+            for client in clients:
+                client.poll()
+
+        problems = []
+        if not clicks:
+            problems.append("no press and release was sent in one tick")
+        if lost_releases:
+            problems.append(f"{lost_releases} bow releases sent together with their press were lost")
+        connections = {connection.own_id : connection for connection in server.clients.values()}
+        report_lines = []
+        for ind_client, client in enumerate(clients):
+            connection = connections.get(client.own_id)
+            if client.player is None or connection is None:
+                problems.append(f"client {ind_client} never got its player")
+                continue
+            error = client.player.pos.distance_to(connection.player.pos)
+            mean_size = client.snapshot_bytes_received / max(1, client.snapshots_received)
+            report_lines.append(
+                f"client {ind_client}: {input_counts[ind_client]} inputs, acked {connection.last_input_seq}, "
+                f"position error {error:.2f} px, {client.correction_count} corrections, "
+                f"{client.snapshots_received} snapshots, mean {mean_size:.1f} B, largest {client.largest_snapshot_size} B"
+            )
+            if connection.last_input_seq != input_counts[ind_client]:
+                problems.append(f"client {ind_client}: server simulated {connection.last_input_seq} of {input_counts[ind_client]} inputs")
+            if error > NET_RECONCILE_TOLERANCE:
+                problems.append(f"client {ind_client}: predicted {client.player.pos} but server has {connection.player.pos}")
+            if client.correction_count:
+                problems.append(f"client {ind_client}: prediction was corrected {client.correction_count} times")
+            if not client.snapshots_received:
+                problems.append(f"client {ind_client}: no snapshots received")
+            if client.largest_snapshot_size > MAX_SNAPSHOT_SIZE:
+                problems.append(f"client {ind_client}: {client.largest_snapshot_size} B snapshot exceeds {MAX_SNAPSHOT_SIZE} B")
+        return report_lines, problems
+    finally:
+        for client in clients:
+            client.close()
+        server.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a server and clients on localhost and check prediction and snapshot sizes.")
+    parser.add_argument('--ticks', type=int, default=600)
+    parser.add_argument('--clients', type=int, default=2)
+    args = parser.parse_args()
+    report_lines, problems = run_localhost_check(args.ticks, args.clients)
+    print("\n".join(report_lines))
+    for problem in problems:
+        print("FAIL:", problem)
+    sys.exit(1 if problems else 0)
\ No newline at end of file
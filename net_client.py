@@ -0,0 +1,202 @@
+import socket
+import struct
+import sys
+from collections import deque, OrderedDict
+from geometry import Vector2, Rect
+from entity import Entity
+from player import Player
+from timers import TimerScheduler
+from net_protocol import *
+from constants import *
+
+ENTITY_APPEARANCE = {
+    KIND_PLAYER : ("blue", (30, 30)),
+    KIND_ENEMY : ("red", (ENEMY_SPRITE_WIDTH, ENEMY_SPRITE_HEIGHT)),
+    KIND_SWORD : ("green", (30, 30)),
+    KIND_ARROW : (ARROW_COLOR, ARROW_IMAGE_SIZE),
+}
+
+class RemoteEntity(Entity):
+    # Client-side mirror of a server entity, driven only by snapshots.
+    def __init__(self, entity_id : int, kind : int):
+        super().__init__()
+        self.entity_id = entity_id
+        self.kind = kind
+        self.color, self.image_size = ENTITY_APPEARANCE[kind]
+        self.pos = Vector2(0, 0)
+        self.rect = Rect.from_center(self.pos, *self.image_size)
+        self.state_name = STATE_NAMES[0]
+        self.health = 0
+        self.angle = 0.0
+
+    def apply_record(self, record : tuple):
+        _, x, y, state_index, health, angle = record
+        self.pos.update(dequantize_position(x), dequantize_position(y))
+        self.rect.center = self.pos
+        self.state_name = STATE_NAMES[state_index] if state_index < len(STATE_NAMES) else STATE_NAMES[0]
+        self.health = health
+        self.angle = float(angle)
+
+class GameClient:
+    def __init__(self, server_address : tuple):
+        self.server_address = server_address
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        self.input_seq = 0
+        self.sent_inputs : deque[tuple[int, dict]] = deque(maxlen=NET_INPUT_REDUNDANCY)
+        self.predicted_positions : OrderedDict[int, Vector2] = OrderedDict()
+        self.snapshot_history : OrderedDict[int, dict[int, tuple]] = OrderedDict()
+        self.latest_snapshot_seq = 0
+        self.own_id = None
+        self.remote_entities : dict[int, RemoteEntity] = {}
+        self.player : Player | None = None
+        self.timers = TimerScheduler()
+        self.player_alive = True
+        self.local_events_queue = deque()
+        self.snapshots_received = 0
+        self.snapshot_bytes_received = 0
+        self.largest_snapshot_size = 0
+        self.correction_count = 0
+
+    def send_input(self, input_state : dict, current_time : int):
+        # Client-side prediction: the local player moves at once and the server
+        # position is reconciled against the prediction made for the same input.
+        self.input_seq += 1
+        if self.player is not None and self.player_alive:
+            self.timers.advance(current_time)
+            self.player.update(input_state, self.local_events_queue, current_time)
+            self.local_events_queue.clear()
+            self.predicted_positions[self.input_seq] = self.player.pos.copy()
+            while len(self.predicted_positions) > NET_SNAPSHOT_HISTORY * NET_SNAPSHOT_INTERVAL:
+                self.predicted_positions.popitem(last=False)
+        self.sent_inputs.append((self.input_seq, input_state))
+        self.send(encode_input_packet(self.latest_snapshot_seq, list(self.sent_inputs)))
+
+    def send(self, packet : bytes):
+        try:
+            self.socket.sendto(packet, self.server_address)
+        except OSError:
+            pass
+
+    def poll(self):
+        while True:
+            try:
+                data, _ = self.socket.recvfrom(65536)
+            except (BlockingIOError, ConnectionResetError):
+                return
+            if data[:1] == PACKET_SNAPSHOT:
+                self.snapshots_received += 1
+                self.snapshot_bytes_received += len(data)
+                self.largest_snapshot_size = max(self.largest_snapshot_size, len(data))
+                try:
+                    self.apply_snapshot(decode_snapshot(data))
+                except struct.error:
+                    continue
+
+    def apply_snapshot(self, snapshot : dict):
+        if snapshot['seq'] <= self.latest_snapshot_seq:
+            return
+        if snapshot['base_seq']:
+            base_records = self.snapshot_history.get(snapshot['base_seq'])
+            if base_records is None:
+                return
+        else:
+            base_records = {}
+        records = apply_snapshot_delta(base_records, snapshot['changed'], snapshot['removed_ids'])
+        self.snapshot_history[snapshot['seq']] = records
+        while len(self.snapshot_history) > NET_SNAPSHOT_HISTORY:
+            self.snapshot_history.popitem(last=False)
+        self.latest_snapshot_seq = snapshot['seq']
+        self.own_id = snapshot['own_id']
+
+        for entity_id in list(self.remote_entities):
+            if entity_id not in records or entity_id == self.own_id:
+                self.remote_entities.pop(entity_id).kill()
+        for entity_id, record in records.items():
+            if entity_id == self.own_id:
+                continue
+            remote_entity = self.remote_entities.get(entity_id)
+            if remote_entity is None or remote_entity.kind != record[0]:
+                remote_entity = self.remote_entities[entity_id] = RemoteEntity(entity_id, record[0])
+            remote_entity.apply_record(record)
+
+        own_record = records.get(self.own_id)
+        if own_record is None:
+            if self.player is not None:
+                self.player_alive = False
+            return
+        self.reconcile_player(own_record, snapshot['last_input_seq'])
+
+    def reconcile_player(self, own_record : tuple, last_input_seq : int):
+        server_pos = Vector2(dequantize_position(own_record[1]), dequantize_position(own_record[2]))
+        if self.player is None:
+            self.player = Player(
+                server_pos, PLAYER_SPEED, WIDTH, HEIGHT, PLAYER_HEALTH, PLAYER_DASH_SPEED,
+                PLAYER_DASH_DURATION, PLAYER_DASH_COOLDOWN, PLAYER_MIN_TENSION_DURATION, PLAYER_MAX_TENSION_DURATION,
+                self.timers
+            )
+        self.player.health = own_record[4]
+        predicted_pos = self.predicted_positions.get(last_input_seq)
+        while self.predicted_positions and next(iter(self.predicted_positions)) <= last_input_seq:
+            self.predicted_positions.popitem(last=False)
+        if predicted_pos is None:
+            return
+        error = server_pos - predicted_pos
+        if error.length_squared() > NET_RECONCILE_SNAP_DISTANCE * NET_RECONCILE_SNAP_DISTANCE:
+            self.player.pos.update(server_pos)
+            self.predicted_positions.clear()
+        elif error.length_squared() > NET_RECONCILE_TOLERANCE * NET_RECONCILE_TOLERANCE:
+            self.player.pos += error
+            for later_pos in self.predicted_positions.values():
+                later_pos += error
+        else:
+            return
+        self.correction_count += 1
+        self.player.rect.center = self.player.pos
+
+    def get_entities(self):
+        entities = list(self.remote_entities.values())
+        if self.player is not None and self.player_alive:
+            entities.append(self.player)
+        return entities
+
+    def close(self):
+        self.send(PACKET_LEAVE)
+        self.socket.close()
+
+def run_client(host : str, port : int = NET_PORT):
+    import pygame
+    from main import read_input_state
+    from camera import Camera
+    from world_objects import Wall
+    from render import Renderer
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    clock = pygame.time.Clock()
+    camera = Camera(WIDTH, HEIGHT, MAP_WIDTH_PX, MAP_HEIGHT_PX)
+    renderer = Renderer(screen, camera)
+    walls = [Wall(Vector2(ind_col * TILE_SIZE + TILE_SIZE / 2, ind_row * TILE_SIZE + TILE_SIZE / 2))
+             for ind_row, tile_row in enumerate(TILE_MAP)
+             for ind_col, tile_char in enumerate(tile_row) if tile_char == "W"]
+    client = GameClient((host, port))
+    running = True
+    while running:
+        clock.tick(FPS)
+        current_time = pygame.time.get_ticks()
+        input_state = read_input_state(camera)
+        if input_state['quit_requested']:
+            break
+        client.send_input(input_state, current_time)
+        client.poll()
+        if client.player is not None:
+            if not client.player_alive:
+                running = False
+            camera.update(client.player)
+        renderer.draw(walls + client.get_entities())
+        pygame.display.flip()
+    client.close()
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_client(sys.argv[1] if len(sys.argv) > 1 else '127.0.0.1', int(sys.argv[2]) if len(sys.argv) > 2 else NET_PORT)
\ No newline at end of file
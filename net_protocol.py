@@ -0,0 +1,168 @@
+import struct
+import numpy as np
+from geometry import Vector2
+from entity import Entity
+from projectiles import ProjectileSystem
+from constants import *
+
+PACKET_INPUT = b'I'
+PACKET_LEAVE = b'L'
+PACKET_SNAPSHOT = b'S'
+
+KIND_PLAYER = 0
+KIND_ENEMY = 1
+KIND_SWORD = 2
+KIND_ARROW = 3
+ENTITY_KINDS = {'Player' : KIND_PLAYER, 'Enemy' : KIND_ENEMY, 'SwordComponent' : KIND_SWORD}
+
+STATE_NAMES = [
+    'PlayerIdleState', 'PlayerMovingState', 'PlayerDashingState', 'PlayerChargingBowState',
+    'PlayerShootingState', 'PlayerDyingState',
+    'EnemyIdleState', 'EnemyAttackingState', 'EnemyDyingState',
+    'SwordIdleState', 'SwordSwingState', 'SwordStrikeState', 'SwordCooldownState',
+    'ArrowIdleState', 'ArrowFlyingState', 'ArrowDestroyingState',
+]
+STATE_INDEX = {state_name : ind_state for ind_state, state_name in enumerate(STATE_NAMES)}
+
+INPUT_BUTTONS = [
+    'key_button_W_hold', 'key_button_A_hold', 'key_button_S_hold', 'key_button_D_hold',
+    'mouse_button_left_hold', 'mouse_button_left_pressed', 'mouse_button_left_released',
+    'key_button_SPACE_pressed',
+]
+
+_INPUT_HEADER = struct.Struct('!cIB')
+_INPUT_ENTRY = struct.Struct('!IBff')
+_SNAPSHOT_HEADER = struct.Struct('!cIIIIHH')
+_ENTITY_HEADER = struct.Struct('!IB')
+_ENTITY_ID = struct.Struct('!I')
+
+# Record fields: kind, x, y, state, health, angle. Each delta entry carries a
+# bit mask of the fields that differ from the base snapshot.
+_FIELD_FORMATS = [struct.Struct('!B'), struct.Struct('!H'), struct.Struct('!H'),
+                  struct.Struct('!B'), struct.Struct('!h'), struct.Struct('!h')]
+_ALL_FIELDS_MASK = (1 << len(_FIELD_FORMATS)) - 1
+# Upper bound on a snapshot: every capped entity sent in full and as many removed.
+MAX_SNAPSHOT_SIZE = _SNAPSHOT_HEADER.size + NET_MAX_SNAPSHOT_ENTITIES * (
+    _ENTITY_HEADER.size + sum(field_format.size for field_format in _FIELD_FORMATS) + _ENTITY_ID.size)
+
+def get_entity_kind(entity : Entity):
+    return ENTITY_KINDS.get(type(entity).__name__)
+
+def quantize_position(value : float):
+    return max(0, min(0xFFFF, round(value * NET_POSITION_QUANT)))
+
+def dequantize_position(value : int):
+    return value / NET_POSITION_QUANT
+
+def make_entity_record(entity : Entity):
+    kind = get_entity_kind(entity)
+    # The sword's hit box moves around its owner, so its rect is what matters.
+    pos = entity.rect.center if kind == KIND_SWORD else entity.pos
+    return (
+        kind,
+        quantize_position(pos[0]),
+        quantize_position(pos[1]),
+        STATE_INDEX.get(type(entity.current_state_obj).__name__, 0),
+        max(-0x8000, min(0x7FFF, round(getattr(entity, 'health', 0)))),
+        round(getattr(entity, 'angle', 0.0)) % 360,
+    )
+
+def make_projectile_records(projectiles : ProjectileSystem, indices : np.ndarray | None = None):
+    if indices is None:
+        indices = np.arange(projectiles.count)
+    positions = np.clip(np.rint(projectiles.positions[indices] * NET_POSITION_QUANT), 0, 0xFFFF).astype(np.int64)
+    states = np.where(projectiles.flying[indices], STATE_INDEX['ArrowFlyingState'], STATE_INDEX['ArrowIdleState'])
+    angles = np.rint(projectiles.angles[indices]).astype(np.int64) % 360
+    return {
+        entity_id : (KIND_ARROW, x, y, state, 0, angle)
+        for entity_id, x, y, state, angle in zip(projectiles.ids[indices].tolist(), positions[:, 0].tolist(),
+                                                 positions[:, 1].tolist(), states.tolist(), angles.tolist())
+    }
+
+def encode_input_packet(ack_snapshot_seq : int, inputs : list[tuple[int, dict]]):
+    chunks = [_INPUT_HEADER.pack(PACKET_INPUT, ack_snapshot_seq, len(inputs))]
+    for input_seq, input_state in inputs:
+        buttons = 0
+        for ind_button, button_name in enumerate(INPUT_BUTTONS):
+            if input_state.get(button_name):
+                buttons |= 1 << ind_button
+        mouse_pos_world = input_state.get('mouse_pos_world') or (0, 0)
+        chunks.append(_INPUT_ENTRY.pack(input_seq, buttons, mouse_pos_world[0], mouse_pos_world[1]))
+    return b''.join(chunks)
+
+def decode_input_packet(data : bytes):
+    _, ack_snapshot_seq, count = _INPUT_HEADER.unpack_from(data, 0)
+    offset = _INPUT_HEADER.size
+    inputs = []
+    for _ in range(count):
+        input_seq, buttons, mouse_x, mouse_y = _INPUT_ENTRY.unpack_from(data, offset)
+        offset += _INPUT_ENTRY.size
+        input_state = {button_name : bool(buttons & (1 << ind_button)) for ind_button, button_name in enumerate(INPUT_BUTTONS)}
+        input_state['mouse_pos_world'] = Vector2(mouse_x, mouse_y)
+        inputs.append((input_seq, input_state))
+    return ack_snapshot_seq, inputs
+
+def encode_snapshot(seq : int, base_seq : int, last_input_seq : int, own_id : int,
+                    records : dict[int, tuple], base_records : dict[int, tuple] | None):
+    # base_seq 0 means a full snapshot; otherwise only differences from base_records are sent.
+    base_records = base_records or {}
+    entries = []
+    for entity_id, record in records.items():
+        base_record = base_records.get(entity_id)
+        if base_record is None:
+            mask = _ALL_FIELDS_MASK
+        else:
+            mask = 0
+            for ind_field, value in enumerate(record):
+                if value != base_record[ind_field]:
+                    mask |= 1 << ind_field
+            if not mask:
+                continue
+        entry = [_ENTITY_HEADER.pack(entity_id, mask)]
+        for ind_field, field_format in enumerate(_FIELD_FORMATS):
+            if mask & (1 << ind_field):
+                entry.append(field_format.pack(record[ind_field]))
+        entries.append(b''.join(entry))
+    removed_ids = [entity_id for entity_id in base_records if entity_id not in records]
+    return b''.join([
+        _SNAPSHOT_HEADER.pack(PACKET_SNAPSHOT, seq, base_seq, last_input_seq, own_id, len(entries), len(removed_ids)),
+        *entries,
+        *(_ENTITY_ID.pack(entity_id) for entity_id in removed_ids),
+    ])
+
+def decode_snapshot(data : bytes):
+    _, seq, base_seq, last_input_seq, own_id, changed_count, removed_count = _SNAPSHOT_HEADER.unpack_from(data, 0)
+    offset = _SNAPSHOT_HEADER.size
+    changed = {}
+    for _ in range(changed_count):
+        entity_id, mask = _ENTITY_HEADER.unpack_from(data, offset)
+        offset += _ENTITY_HEADER.size
+        fields = {}
+        for ind_field, field_format in enumerate(_FIELD_FORMATS):
+            if mask & (1 << ind_field):
+                fields[ind_field] = field_format.unpack_from(data, offset)[0]
+                offset += field_format.size
+        changed[entity_id] = fields
+    removed_ids = []
+    for _ in range(removed_count):
+        removed_ids.append(_ENTITY_ID.unpack_from(data, offset)[0])
+        offset += _ENTITY_ID.size
+    return {
+        'seq' : seq,
+        'base_seq' : base_seq,
+        'last_input_seq' : last_input_seq,
+        'own_id' : own_id,
+        'changed' : changed,
+        'removed_ids' : removed_ids,
+    }
+
+def apply_snapshot_delta(base_records : dict[int, tuple], changed : dict[int, dict], removed_ids : list[int]):
+    records = dict(base_records)
+    for entity_id in removed_ids:
+        records.pop(entity_id, None)
+    for entity_id, fields in changed.items():
+        record = list(records.get(entity_id, (0,) * len(_FIELD_FORMATS)))
+        for ind_field, value in fields.items():
+            record[ind_field] = value
+        records[entity_id] = tuple(record)
+    return records
\ No newline at end of file
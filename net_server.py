@@ -0,0 +1,177 @@
+import socket
+import struct
+import time
+import numpy as np
+from collections import deque, OrderedDict
+from player import Player
+from world import World
+from spatial_hash import SpatialHash
+from net_protocol import *
+from constants import *
+
+class ClientConnection:
+    def __init__(self, address : tuple, player : Player, current_time : int):
+        self.address = address
+        self.player = player
+        self.own_id = player.entity_id
+        self.pending_inputs : deque[tuple[int, dict]] = deque()
+        self.last_input_seq = 0
+        self.ack_snapshot_seq = 0
+        self.snapshot_history : OrderedDict[int, dict[int, tuple]] = OrderedDict()
+        self.last_seen_time = current_time
+
+    def receive_inputs(self, inputs : list[tuple[int, dict]]):
+        # Inputs arrive redundantly, so only the ones not seen yet are queued.
+        newest_seq = self.pending_inputs[-1][0] if self.pending_inputs else self.last_input_seq
+        for input_seq, input_state in inputs:
+            if input_seq > newest_seq:
+                self.pending_inputs.append((input_seq, input_state))
+                newest_seq = input_seq
+
+    def take_inputs(self):
+        # Every input is simulated as one step, in seq order, exactly as the client
+        # predicted it; a tick without inputs leaves the player where it is.
+        input_states = []
+        while self.pending_inputs and len(input_states) < NET_MAX_INPUTS_PER_TICK:
+            self.last_input_seq, input_state = self.pending_inputs.popleft()
+            input_states.append(input_state)
+        return input_states
+
+class GameServer:
+    def __init__(self, host : str = '0.0.0.0', port : int = NET_PORT):
+        self.world = World()
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind((host, port))
+        self.socket.setblocking(False)
+        self.address = self.socket.getsockname()
+        self.clients : dict[tuple, ClientConnection] = {}
+        self.relevance_hash = SpatialHash(NET_RELEVANCE_DISTANCE // 4)
+        self.snapshot_seq = 0
+        self.tick_index = 0
+        self.start_time = time.monotonic()
+        self.running = True
+
+    def get_current_time(self):
+        return int((time.monotonic() - self.start_time) * 1000)
+
+    def poll(self, current_time : int):
+        while True:
+            try:
+                data, address = self.socket.recvfrom(2048)
+            except (BlockingIOError, ConnectionResetError):
+                return
+            if not data:
+                continue
+            if data[:1] == PACKET_INPUT:
+                connection = self.clients.get(address)
+                if connection is None:
+                    if len(self.clients) >= NET_MAX_PLAYERS:
+                        continue
+                    connection = ClientConnection(address, self.world.add_player(), current_time)
+                    self.clients[address] = connection
+                try:
+                    ack_snapshot_seq, inputs = decode_input_packet(data)
+                except struct.error:
+                    continue
+                connection.ack_snapshot_seq = max(connection.ack_snapshot_seq, ack_snapshot_seq)
+                connection.last_seen_time = current_time
+                connection.receive_inputs(inputs)
+            elif data[:1] == PACKET_LEAVE:
+                self.drop_client(address)
+
+    def drop_client(self, address : tuple):
+        connection = self.clients.pop(address, None)
+        if connection is not None:
+            connection.player.kill()
+
+    def tick(self, current_time : int | None = None):
+        if current_time is None:
+            current_time = self.get_current_time()
+        self.poll(current_time)
+        for address, connection in list(self.clients.items()):
+            if current_time - connection.last_seen_time > NET_CLIENT_TIMEOUT:
+                self.drop_client(address)
+        inputs = {connection.player : connection.take_inputs() for connection in self.clients.values()}
+        self.world.update(inputs, current_time)
+        self.world.process_events()
+        self.tick_index += 1
+        if self.tick_index % NET_SNAPSHOT_INTERVAL == 0:
+            self.send_snapshots()
+
+    def send_snapshots(self):
+        self.snapshot_seq += 1
+        self.relevance_hash.clear()
+        for entity_group in (self.world.players_group, self.world.enemies_group):
+            for entity in entity_group:
+                self.relevance_hash.insert(entity, entity.pos)
+                if hasattr(entity, 'sword_component'):
+                    self.relevance_hash.insert(entity.sword_component, entity.pos)
+        record_cache : dict[int, tuple] = {}
+        relevance_distance_squared = NET_RELEVANCE_DISTANCE * NET_RELEVANCE_DISTANCE
+        projectiles = self.world.projectiles
+        projectile_positions = projectiles.positions[:projectiles.count]
+        for connection in self.clients.values():
+            # Only the entities nearest to the client's player are sent, which keeps
+            # packet size and encoding cost flat however many enemies the world holds.
+            focus_pos = connection.player.pos
+            relevant_entities = []
+            for entity in self.relevance_hash.query(focus_pos, NET_RELEVANCE_DISTANCE):
+                if entity.alive():
+                    distance_squared = focus_pos.distance_squared_to(entity.pos)
+                    if distance_squared <= relevance_distance_squared:
+                        relevant_entities.append((distance_squared, entity.entity_id, entity))
+            # Arrows are filtered in one array pass; at most the cap of the nearest ones can be sent.
+            projectile_distances = ((projectile_positions - (focus_pos.x, focus_pos.y)) ** 2).sum(axis=1)
+            near_indices = np.flatnonzero(projectile_distances <= relevance_distance_squared)
+            if len(near_indices) > NET_MAX_SNAPSHOT_ENTITIES:
+                nearest = np.argpartition(projectile_distances[near_indices], NET_MAX_SNAPSHOT_ENTITIES - 1)
+                near_indices = near_indices[nearest[:NET_MAX_SNAPSHOT_ENTITIES]]
+            projectile_records = make_projectile_records(projectiles, near_indices)
+            for distance_squared, entity_id in zip(projectile_distances[near_indices].tolist(), projectile_records):
+                relevant_entities.append((distance_squared, entity_id, None))
+            relevant_entities.sort(key=lambda relevant_entity: relevant_entity[:2])
+            records = {}
+            for _, entity_id, entity in relevant_entities[:NET_MAX_SNAPSHOT_ENTITIES]:
+                if entity is None:
+                    records[entity_id] = projectile_records[entity_id]
+                    continue
+                record = record_cache.get(entity_id)
+                if record is None:
+                    record = record_cache[entity_id] = make_entity_record(entity)
+                records[entity_id] = record
+            base_records = connection.snapshot_history.get(connection.ack_snapshot_seq)
+            base_seq = connection.ack_snapshot_seq if base_records is not None else 0
+            packet = encode_snapshot(self.snapshot_seq, base_seq, connection.last_input_seq,
+                                     connection.own_id, records, base_records)
+            try:
+                self.socket.sendto(packet, connection.address)
+            except OSError:
+                pass
+            connection.snapshot_history[self.snapshot_seq] = records
+            while len(connection.snapshot_history) > NET_SNAPSHOT_HISTORY:
+                connection.snapshot_history.popitem(last=False)
+
+    def serve_forever(self):
+        tick_duration = 1 / FPS
+        next_tick_time = time.monotonic()
+        while self.running:
+            self.tick()
+            next_tick_time += tick_duration
+            delay = next_tick_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick_time = time.monotonic()
+
+    def close(self):
+        self.socket.close()
+
+if __name__ == "__main__":
+    server = GameServer()
+    print(f"Server listening on {server.address[0]}:{server.address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
\ No newline at end of file
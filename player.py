@@ -1,12 +1,11 @@
-import pygame
-from pygame.math import Vector2
+from geometry import Vector2, Rect
+from entity import Entity
+from world_objects import get_wall_collisions
 from collections import deque
 from state import State
 from components import DashComponent, TensionBowstringComponent
+from timers import TimerScheduler
 from constants import *
-from typing import TYPE_CHECKING
-if TYPE_CHECKING:
-    from .world_objects import Wall
 
 class PlayerIdleState(State['Player']):
     def __init__(self, player):
@@ -61,24 +60,24 @@ class PlayerDashingState(State['Player']):
         
     def enter(self):
         self.context.is_invincible = True
+        player_dash = self.context.dash_component
+        self.dash_end_timer = self.context.timers.schedule(player_dash.dash_start_time + player_dash.dash_duration,
+                                                           self.finish_dash)
     
     def exit(self):
+        self.dash_end_timer.cancel()
         self.context.is_invincible = False
+        
+    def finish_dash(self, current_time : int):
+        self.context.dash_component.stop_dashing(current_time)
+        self.context.velocity = Vector2(0, 0)
+        if self.context.current_input_movement_vector.length_squared() == 0:
+            self.context.change_state(PlayerIdleState(self.context))
+        else:
+            self.context.change_state(PlayerMovingState(self.context))
 
     def update(self, current_time : int, game_events_queue : deque):
-        player_dash = self.context.dash_component
-        if player_dash.is_dashing:
-            if current_time - player_dash.dash_start_time >= player_dash.dash_duration:
-                player_dash.is_dashing = False
-                player_dash.last_dash_end_time = current_time
-                player_dash.current_dash_direction = Vector2(0, 0)
-        self.context.velocity = player_dash.get_current_velocity()
-        if not player_dash.is_active():
-            move_direction_vector = self.context.current_input_movement_vector
-            if move_direction_vector.length_squared() == 0:
-                return PlayerIdleState(self.context)
-            else:
-                return PlayerMovingState(self.context)
+        self.context.velocity = self.context.dash_component.get_current_velocity()
         return None
     
 class PlayerChargingBowState(State['Player']):
@@ -133,13 +132,15 @@ class PlayerDyingState(State['Player']):
         self.context.kill()
         return None
     
-class Player(pygame.sprite.Sprite):
+class Player(Entity):
     def __init__(self, pos : Vector2, speed : int, width : int, height : int, health : int, dash_speed : int,
-                 dash_duration : int, dash_cooldown : int, min_tension_duration : int, max_tension_duration : int):
+                 dash_duration : int, dash_cooldown : int, min_tension_duration : int, max_tension_duration : int,
+                 timers : TimerScheduler):
         super().__init__()
-        self.image = pygame.Surface([30, 30])
-        self.image.fill("blue")
-        self.rect = self.image.get_rect(center=pos)
+        self.timers = timers
+        self.color = "blue"
+        self.image_size = (30, 30)
+        self.rect = Rect.from_center(pos, 30, 30)
         self.pos = pos
         self.speed = speed
         self.width = width
@@ -170,7 +171,7 @@ class Player(pygame.sprite.Sprite):
             if self.health <= 0:
                 self.change_state(PlayerDyingState(self))
           
-    def update(self, input_state : dict, game_events_queue : deque, current_time : int, walls : pygame.sprite.Group):
+    def update(self, input_state : dict, game_events_queue : deque, current_time : int):
         self.current_input_movement_vector = Vector2(0,0)
         
         if input_state.get('key_button_W_hold'): self.current_input_movement_vector.y = -1
@@ -192,23 +193,23 @@ class Player(pygame.sprite.Sprite):
         self.pos.x += self.velocity.x
         self.rect.centerx = self.pos.x
             
-        x_collisions : list['Wall'] = pygame.sprite.spritecollide(self, walls, False)
-        for wall_hit in x_collisions:
+        x_collisions : list[Rect] = get_wall_collisions(self.rect)
+        for wall_rect in x_collisions:
             if self.velocity.x > 0:
-                self.rect.right = wall_hit.rect.left
+                self.rect.right = wall_rect.left
             elif self.velocity.x < 0:
-                self.rect.left = wall_hit.rect.right
+                self.rect.left = wall_rect.right
             self.pos.x = self.rect.centerx
             self.velocity.x = 0
             
         self.pos.y += self.velocity.y
         self.rect.centery = self.pos.y
             
-        y_collisions : list['Wall'] = pygame.sprite.spritecollide(self, walls, False)
-        for wall_hit in y_collisions:
+        y_collisions : list[Rect] = get_wall_collisions(self.rect)
+        for wall_rect in y_collisions:
             if self.velocity.y > 0:
-                self.rect.bottom = wall_hit.rect.top
+                self.rect.bottom = wall_rect.top
             elif self.velocity.y < 0:
-                self.rect.top = wall_hit.rect.bottom
+                self.rect.top = wall_rect.bottom
             self.pos.y = self.rect.centery
             self.velocity.y = 0
\ No newline at end of file
@@ -0,0 +1,161 @@
+import numpy as np
+from collections import deque
+from entity import EntityGroup, allocate_entity_id
+from constants import *
+
+class ProjectileSystem:
+    # Arrows live in parallel NumPy arrays instead of one entity each: motion,
+    # wall tests and enemy hits are done for every arrow at once.
+    def __init__(self, capacity : int = PROJECTILE_INITIAL_CAPACITY):
+        self.count = 0
+        self.positions = np.zeros((capacity, 2))
+        self.velocities = np.zeros((capacity, 2))
+        self.sizes = np.zeros((capacity, 2), dtype=np.int64)
+        self.damages = np.zeros(capacity)
+        self.angles = np.zeros(capacity)
+        self.flying = np.zeros(capacity, dtype=bool)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.rebuild_wall_grid()
+
+    def __len__(self):
+        return self.count
+
+    def rebuild_wall_grid(self):
+        # Rows may differ in length; missing tiles count as walls, like tiles outside the map.
+        map_width_tiles = max(len(tile_row) for tile_row in TILE_MAP)
+        self.wall_grid = np.array([[tile_char == 'W' for tile_char in tile_row.ljust(map_width_tiles, 'W')]
+                                   for tile_row in TILE_MAP], dtype=bool)
+
+    def _reserve(self, extra : int):
+        capacity = len(self.positions)
+        if self.count + extra <= capacity:
+            return
+        new_capacity = max(capacity * 2, self.count + extra)
+        for name in ('positions', 'velocities', 'sizes', 'damages', 'angles', 'flying', 'ids'):
+            old_array = getattr(self, name)
+            new_array = np.zeros((new_capacity,) + old_array.shape[1:], dtype=old_array.dtype)
+            new_array[:self.count] = old_array[:self.count]
+            setattr(self, name, new_array)
+
+    def spawn_many(self, shots : list[dict]):
+        # shots are ARROW_SHOT events; the whole batch is initialised with array operations.
+        if not shots:
+            return
+        shot_count = len(shots)
+        self._reserve(shot_count)
+        start = np.array([(shot['start_pos'][0], shot['start_pos'][1]) for shot in shots], dtype=float)
+        target = np.array([(shot['target_pos'][0], shot['target_pos'][1]) for shot in shots], dtype=float)
+        speeds = np.array([shot['speed'] for shot in shots], dtype=float)
+        direction = target - start
+        lengths = np.hypot(direction[:, 0], direction[:, 1])
+        flying = (lengths > 0) & np.array([shot['state'] != 'idle' for shot in shots])
+        safe_lengths = np.where(flying, lengths, 1.0)
+        velocities = np.where(flying[:, None], direction / safe_lengths[:, None] * speeds[:, None], 0.0)
+        angle_radians = np.arctan2(velocities[:, 1], velocities[:, 0])
+        # Hit boxes are the bounding box of the rotated arrow image, as the sprite version had.
+        arrow_width, arrow_height = ARROW_IMAGE_SIZE
+        widths = np.rint(np.abs(arrow_width * np.cos(angle_radians)) + np.abs(arrow_height * np.sin(angle_radians))).astype(np.int64)
+        heights = np.rint(np.abs(arrow_width * np.sin(angle_radians)) + np.abs(arrow_height * np.cos(angle_radians))).astype(np.int64)
+
+        new_slots = slice(self.count, self.count + shot_count)
+        self.positions[new_slots] = start
+        self.velocities[new_slots] = velocities
+        self.sizes[new_slots, 0] = widths
+        self.sizes[new_slots, 1] = heights
+        self.damages[new_slots] = [shot['damage'] * shot['tension'] for shot in shots]
+        self.angles[new_slots] = np.degrees(angle_radians)
+        self.flying[new_slots] = flying
+        self.ids[new_slots] = [allocate_entity_id() for _ in range(shot_count)]
+        self.count += shot_count
+
+    def get_rects(self):
+        # Integer rects with the same rounding as Rect.from_center: (left, top, width, height).
+        sizes = self.sizes[:self.count]
+        lefts = np.rint(self.positions[:self.count, 0]).astype(np.int64) - sizes[:, 0] // 2
+        tops = np.rint(self.positions[:self.count, 1]).astype(np.int64) - sizes[:, 1] // 2
+        return lefts, tops, sizes[:, 0], sizes[:, 1]
+
+    def _hits_walls(self, lefts : np.ndarray, tops : np.ndarray, widths : np.ndarray, heights : np.ndarray):
+        # An arrow's box is smaller than a tile, so its four corner tiles are all the tiles it covers.
+        map_height_tiles, map_width_tiles = self.wall_grid.shape
+        hits = np.zeros(len(lefts), dtype=bool)
+        for corner_x, corner_y in ((lefts, tops), (lefts + widths - 1, tops),
+                                   (lefts, tops + heights - 1), (lefts + widths - 1, tops + heights - 1)):
+            cols = corner_x // TILE_SIZE
+            rows = corner_y // TILE_SIZE
+            inside = (rows >= 0) & (rows < map_height_tiles) & (cols >= 0) & (cols < map_width_tiles)
+            hits |= ~inside
+            hits[inside] |= self.wall_grid[rows[inside], cols[inside]]
+        return hits
+
+    def _find_enemy_hits(self, lefts : np.ndarray, tops : np.ndarray, widths : np.ndarray, heights : np.ndarray,
+                         enemies : list):
+        # Broad phase on a tile occupancy grid, exact rect test only for arrows that share a tile with an enemy.
+        hits : dict[int, list] = {}
+        if not enemies or not len(lefts):
+            return hits
+        enemy_rects = np.array([(enemy.rect.x, enemy.rect.y, enemy.rect.width, enemy.rect.height) for enemy in enemies],
+                               dtype=np.int64)
+        map_height_tiles, map_width_tiles = self.wall_grid.shape
+        occupancy = np.zeros((map_height_tiles + 2, map_width_tiles + 2), dtype=bool)
+        enemy_right = enemy_rects[:, 0] + enemy_rects[:, 2] - 1
+        enemy_bottom = enemy_rects[:, 1] + enemy_rects[:, 3] - 1
+        for corner_x, corner_y in ((enemy_rects[:, 0], enemy_rects[:, 1]), (enemy_right, enemy_rects[:, 1]),
+                                   (enemy_rects[:, 0], enemy_bottom), (enemy_right, enemy_bottom)):
+            occupancy[np.clip(corner_y // TILE_SIZE + 1, 0, map_height_tiles + 1),
+                      np.clip(corner_x // TILE_SIZE + 1, 0, map_width_tiles + 1)] = True
+        candidates = np.zeros(len(lefts), dtype=bool)
+        for corner_x, corner_y in ((lefts, tops), (lefts + widths - 1, tops),
+                                   (lefts, tops + heights - 1), (lefts + widths - 1, tops + heights - 1)):
+            candidates |= occupancy[np.clip(corner_y // TILE_SIZE + 1, 0, map_height_tiles + 1),
+                                    np.clip(corner_x // TILE_SIZE + 1, 0, map_width_tiles + 1)]
+        candidate_indices = np.flatnonzero(candidates)
+        for chunk_start in range(0, len(candidate_indices), PROJECTILE_HIT_TEST_CHUNK):
+            chunk = candidate_indices[chunk_start:chunk_start + PROJECTILE_HIT_TEST_CHUNK]
+            overlaps = (lefts[chunk, None] < enemy_rects[None, :, 0] + enemy_rects[None, :, 2]) & \
+                (enemy_rects[None, :, 0] < lefts[chunk, None] + widths[chunk, None]) & \
+                (tops[chunk, None] < enemy_rects[None, :, 1] + enemy_rects[None, :, 3]) & \
+                (enemy_rects[None, :, 1] < tops[chunk, None] + heights[chunk, None])
+            for ind_chunk, ind_enemy in zip(*np.nonzero(overlaps)):
+                hits.setdefault(int(chunk[ind_chunk]), []).append(enemies[ind_enemy])
+        return hits
+
+    def update(self, enemies_group : EntityGroup, game_events_queue : deque):
+        if not self.count:
+            return
+        flying_indices = np.flatnonzero(self.flying[:self.count])
+        if not len(flying_indices):
+            return
+        lefts, tops, widths, heights = (values[flying_indices] for values in self.get_rects())
+        enemy_hits = self._find_enemy_hits(lefts, tops, widths, heights, enemies_group.sprites())
+        wall_hits = self._hits_walls(lefts, tops, widths, heights)
+
+        destroyed = wall_hits
+        if enemy_hits:
+            targets = []
+            amounts_damage = []
+            for ind_flying, enemies in enemy_hits.items():
+                destroyed[ind_flying] = True
+                amount_damage = float(self.damages[flying_indices[ind_flying]])
+                targets.extend(enemies)
+                amounts_damage.extend([amount_damage] * len(enemies))
+            game_events_queue.append({
+                'type' : 'DEALING_DAMAGE_BATCH',
+                'from_what' : 'arrow',
+                'targets' : targets,
+                'amounts_damage' : amounts_damage,
+            })
+
+        moving_indices = flying_indices[~destroyed]
+        self.positions[moving_indices] += self.velocities[moving_indices]
+        if destroyed.any():
+            self.remove(flying_indices[destroyed])
+
+    def remove(self, indices : np.ndarray):
+        keep = np.ones(self.count, dtype=bool)
+        keep[indices] = False
+        kept_count = int(keep.sum())
+        for name in ('positions', 'velocities', 'sizes', 'damages', 'angles', 'flying', 'ids'):
+            array = getattr(self, name)
+            array[:kept_count] = array[:self.count][keep]
+        self.count = kept_count
\ No newline at end of file
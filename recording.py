@@ -0,0 +1,157 @@
+import struct
+import sys
+import zlib
+from bisect import bisect_right
+from world import World
+from net_protocol import make_entity_record, make_projectile_records, encode_snapshot, decode_snapshot, apply_snapshot_delta
+from constants import *
+
+RECORDING_MAGIC = b'PGREC1'
+_RECORDING_HEADER = struct.Struct('!6sB')
+_FRAME_HEADER = struct.Struct('!II')
+FLAG_COMPRESSED = 1
+
+class MatchRecorder:
+    # Frames reuse the network snapshot encoding: a keyframe every
+    # keyframe_interval frames and deltas against the previous frame in between.
+    def __init__(self, path : str, keyframe_interval : int = RECORD_KEYFRAME_INTERVAL, compress : bool = True):
+        self.file = open(path, 'wb')
+        self.keyframe_interval = keyframe_interval
+        self.compressor = zlib.compressobj(RECORD_COMPRESSION_LEVEL) if compress else None
+        self.file.write(_RECORDING_HEADER.pack(RECORDING_MAGIC, FLAG_COMPRESSED if compress else 0))
+        self.frame_index = 0
+        self.previous_records : dict[int, tuple] | None = None
+
+    def record(self, world : World, current_time : int):
+        records = {}
+        for entity_group in (world.players_group, world.enemies_group):
+            for entity in entity_group:
+                records[entity.entity_id] = make_entity_record(entity)
+                if hasattr(entity, 'sword_component'):
+                    records[entity.sword_component.entity_id] = make_entity_record(entity.sword_component)
+        records.update(make_projectile_records(world.projectiles))
+        focus_id = next(iter(world.players_group.sprites()), None)
+        focus_id = focus_id.entity_id if focus_id is not None else 0
+        is_keyframe = self.frame_index % self.keyframe_interval == 0
+        base_records = None if is_keyframe else self.previous_records
+        base_seq = 0 if is_keyframe else self.frame_index
+        frame = encode_snapshot(self.frame_index + 1, base_seq, 0, focus_id, records, base_records)
+        self.write(_FRAME_HEADER.pack(current_time, len(frame)) + frame)
+        self.previous_records = records
+        self.frame_index += 1
+
+    def write(self, data : bytes):
+        if self.compressor is not None:
+            data = self.compressor.compress(data)
+        self.file.write(data)
+
+    def close(self):
+        if self.compressor is not None:
+            self.file.write(self.compressor.flush())
+        self.file.close()
+
+class MatchRecording:
+    def __init__(self, path : str):
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, flags = _RECORDING_HEADER.unpack_from(data, 0)
+        if magic != RECORDING_MAGIC:
+            raise ValueError(f"{path} is not a match recording")
+        body = data[_RECORDING_HEADER.size:]
+        if flags & FLAG_COMPRESSED:
+            body = zlib.decompress(body)
+        self.frame_times : list[int] = []
+        self.frames : list[dict] = []
+        self.keyframes : list[int] = []
+        offset = 0
+        while offset + _FRAME_HEADER.size <= len(body):
+            frame_time, frame_size = _FRAME_HEADER.unpack_from(body, offset)
+            offset += _FRAME_HEADER.size
+            frame = decode_snapshot(body[offset:offset + frame_size])
+            offset += frame_size
+            if not frame['base_seq']:
+                self.keyframes.append(len(self.frames))
+            self.frame_times.append(frame_time)
+            self.frames.append(frame)
+        self._cached_index = -1
+        self._cached_records : dict[int, tuple] = {}
+
+    def __len__(self):
+        return len(self.frames)
+
+    def get_records(self, frame_index : int):
+        # Seeking decodes forward from the nearest keyframe, or from the cached
+        # frame when playing forward, so no frame is ever simulated.
+        frame_index = max(0, min(frame_index, len(self.frames) - 1))
+        keyframe_index = self.keyframes[bisect_right(self.keyframes, frame_index) - 1]
+        if keyframe_index <= self._cached_index <= frame_index:
+            ind_frame, records = self._cached_index, self._cached_records
+        else:
+            ind_frame = keyframe_index
+            records = apply_snapshot_delta({}, self.frames[keyframe_index]['changed'], [])
+        while ind_frame < frame_index:
+            ind_frame += 1
+            frame = self.frames[ind_frame]
+            records = apply_snapshot_delta(records, frame['changed'], frame['removed_ids'])
+        self._cached_index, self._cached_records = frame_index, records
+        return records
+
+    def get_focus_id(self, frame_index : int):
+        return self.frames[max(0, min(frame_index, len(self.frames) - 1))]['own_id']
+
+def run_playback(path : str):
+    import pygame
+    from geometry import Vector2
+    from camera import Camera
+    from world_objects import Wall
+    from render import Renderer
+    from net_client import RemoteEntity
+
+    recording = MatchRecording(path)
+    if not len(recording):
+        return
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    clock = pygame.time.Clock()
+    camera = Camera(WIDTH, HEIGHT, MAP_WIDTH_PX, MAP_HEIGHT_PX)
+    renderer = Renderer(screen, camera)
+    walls = [Wall(Vector2(ind_col * TILE_SIZE + TILE_SIZE / 2, ind_row * TILE_SIZE + TILE_SIZE / 2))
+             for ind_row, tile_row in enumerate(TILE_MAP)
+             for ind_col, tile_char in enumerate(tile_row) if tile_char == "W"]
+    entities : dict[int, RemoteEntity] = {}
+    frame_index = 0
+    paused = False
+    running = True
+    while running:
+        clock.tick(FPS)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    paused = not paused
+                elif event.key == pygame.K_RIGHT:
+                    frame_index += FPS * RECORD_SEEK_SECONDS
+                elif event.key == pygame.K_LEFT:
+                    frame_index -= FPS * RECORD_SEEK_SECONDS
+        frame_index = max(0, min(frame_index, len(recording) - 1))
+        records = recording.get_records(frame_index)
+        for entity_id in list(entities):
+            if entity_id not in records:
+                del entities[entity_id]
+        for entity_id, record in records.items():
+            entity = entities.get(entity_id)
+            if entity is None or entity.kind != record[0]:
+                entity = entities[entity_id] = RemoteEntity(entity_id, record[0])
+            entity.apply_record(record)
+        focus_entity = entities.get(recording.get_focus_id(frame_index))
+        if focus_entity is not None:
+            camera.update(focus_entity)
+        renderer.draw(walls + list(entities.values()))
+        pygame.display.flip()
+        if not paused:
+            frame_index += 1
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_playback(sys.argv[1])
\ No newline at end of file
@@ -0,0 +1,57 @@
+import pygame
+import numpy as np
+from entity import Entity
+from camera import Camera
+from projectiles import ProjectileSystem
+from constants import ARROW_IMAGE_SIZE, ARROW_COLOR
+from sprite_registry import get_surface, get_rotated_surface
+
+def get_image(entity : Entity):
+    # The simulation only knows size, color and angle; surfaces live on this side.
+    angle = getattr(entity, 'angle', 0.0)
+    if angle:
+        return get_rotated_surface(entity.image_size[0], entity.image_size[1], entity.color, angle)
+    return get_surface(entity.image_size[0], entity.image_size[1], entity.color)
+
+class Renderer:
+    def __init__(self, screen : pygame.Surface, camera : Camera):
+        self.screen = screen
+        self.camera = camera
+        self.background_color = (30, 30, 30)
+
+    def draw(self, entities, projectiles : ProjectileSystem | None = None):
+        # One pass builds the whole frame's blit list with integer offsets and
+        # hands it to a single Surface.blits call; off-screen entities are skipped.
+        offset_x = round(self.camera.offset.x)
+        offset_y = round(self.camera.offset.y)
+        screen_width, screen_height = self.screen.get_size()
+        blit_list = []
+        for entity in entities:
+            rect = entity.rect
+            screen_x = rect.x - offset_x
+            screen_y = rect.y - offset_y
+            if screen_x < screen_width and screen_y < screen_height and \
+                screen_x + rect.width > 0 and screen_y + rect.height > 0:
+                image = get_image(entity)
+                image_width, image_height = image.get_size()
+                if image_width != rect.width or image_height != rect.height:
+                    screen_x += (rect.width - image_width) // 2
+                    screen_y += (rect.height - image_height) // 2
+                blit_list.append((image, (screen_x, screen_y)))
+        if projectiles is not None and projectiles.count:
+            self.add_projectiles(blit_list, projectiles, offset_x, offset_y, screen_width, screen_height)
+        self.screen.fill(self.background_color)
+        self.screen.blits(blit_list, doreturn=False)
+
+    def add_projectiles(self, blit_list : list, projectiles : ProjectileSystem, offset_x : int, offset_y : int,
+                        screen_width : int, screen_height : int):
+        screen_positions = np.rint(projectiles.positions[:projectiles.count]).astype(np.int64) - (offset_x, offset_y)
+        margin = max(ARROW_IMAGE_SIZE)
+        visible = (screen_positions[:, 0] > -margin) & (screen_positions[:, 0] < screen_width + margin) & \
+            (screen_positions[:, 1] > -margin) & (screen_positions[:, 1] < screen_height + margin)
+        visible_indices = np.flatnonzero(visible)
+        angles = np.rint(projectiles.angles[visible_indices]).astype(np.int64) % 360
+        for (center_x, center_y), angle in zip(screen_positions[visible_indices].tolist(), angles.tolist()):
+            image = get_rotated_surface(ARROW_IMAGE_SIZE[0], ARROW_IMAGE_SIZE[1], ARROW_COLOR, angle)
+            image_width, image_height = image.get_size()
+            blit_list.append((image, (center_x - image_width // 2, center_y - image_height // 2)))
\ No newline at end of file
@@ -0,0 +1,267 @@
+import argparse
+import math
+import multiprocessing
+import random
+import sys
+import time
+import tracemalloc
+from geometry import Vector2
+from world import World
+from world_objects import load_tile_map
+from constants import *
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+SCENARIOS = {
+    'small' : {
+        'map_size' : (60, 40),
+        'waves' : [(0, NUM_ENEMIES)],
+        'volley_interval' : 1000,
+        'volley_arrows' : 10,
+    },
+    'medium' : {
+        'map_size' : (120, 80),
+        'waves' : [(0, 50), (3000, 50)],
+        'volley_interval' : 500,
+        'volley_arrows' : 50,
+    },
+    'large' : {
+        'map_size' : (200, 150),
+        'waves' : [(0, 250), (2000, 250), (4000, 500)],
+        'volley_interval' : 250,
+        'volley_arrows' : 200,
+    },
+    'extreme' : {
+        'map_size' : (300, 300),
+        'waves' : [(0, 1000), (2000, 1000), (4000, 1000)],
+        'volley_interval' : 250,
+        'volley_arrows' : 1000,
+    },
+}
+
+SUBSYSTEMS = ['timers', 'players', 'enemies', 'arrows', 'events', 'render']
+
+def generate_tile_map(width_tiles : int, height_tiles : int, wall_density : float = SCENARIO_WALL_DENSITY, seed : int = 0):
+    rng = random.Random(seed)
+    center_row, center_col = height_tiles // 2, width_tiles // 2
+    tile_map = []
+    for ind_row in range(height_tiles):
+        tile_row = []
+        for ind_col in range(width_tiles):
+            if ind_row in (0, height_tiles - 1) or ind_col in (0, width_tiles - 1):
+                tile_row.append('W')
+            elif abs(ind_row - center_row) <= 1 and abs(ind_col - center_col) <= 1:
+                tile_row.append('P' if (ind_row, ind_col) == (center_row, center_col) else 'F')
+            else:
+                tile_row.append('W' if rng.random() < wall_density else 'F')
+        tile_map.append(''.join(tile_row))
+    return tile_map
+
+def get_scripted_input(current_time : int):
+    # The player walks a square, changing direction every two seconds.
+    direction_buttons = ['key_button_D_hold', 'key_button_S_hold', 'key_button_A_hold', 'key_button_W_hold']
+    input_state = {
+        'quit_requested' : False,
+        'mouse_pos_world' : None,
+        'mouse_button_left_hold' : False,
+        'mouse_button_left_pressed' : False,
+        'mouse_button_left_released' : False,
+        'key_button_W_hold' : False,
+        'key_button_A_hold' : False,
+        'key_button_S_hold' : False,
+        'key_button_D_hold' : False,
+        'key_button_SPACE_pressed' : False,
+    }
+    input_state[direction_buttons[current_time // 2000 % len(direction_buttons)]] = True
+    return input_state
+
+def spawn_wave(world : World, center_pos : Vector2, count : int, rng : random.Random):
+    # Enemies appear on free tiles in a ring around the player so they engage at once.
+    map_height_tiles, map_width_tiles = len(TILE_MAP), len(TILE_MAP[0])
+    spawned = 0
+    attempts = 0
+    while spawned < count and attempts < count * 20:
+        attempts += 1
+        angle = rng.uniform(0, math.tau)
+        distance = rng.uniform(SCENARIO_SPAWN_MIN_DISTANCE, SCENARIO_SPAWN_MAX_DISTANCE)
+        col = int((center_pos.x + math.cos(angle) * distance) // TILE_SIZE)
+        row = int((center_pos.y + math.sin(angle) * distance) // TILE_SIZE)
+        if 0 <= row < map_height_tiles and 0 <= col < map_width_tiles and TILE_MAP[row][col] != 'W':
+            world.spawn_enemy(Vector2(col * TILE_SIZE + TILE_SIZE / 2, row * TILE_SIZE + TILE_SIZE / 2))
+            spawned += 1
+    return spawned
+
+def fire_volley(world : World, start_pos : Vector2, count : int, rng : random.Random):
+    angle_offset = rng.uniform(0, math.tau)
+    for ind_arrow in range(count):
+        angle = angle_offset + math.tau * ind_arrow / count
+        world.game_events_queue.append({
+            'type' : 'ARROW_SHOT',
+            'tension' : 1.0,
+            'start_pos' : start_pos.copy(),
+            'target_pos' : start_pos + Vector2(math.cos(angle), math.sin(angle)) * 100,
+            'speed' : ARROW_SPEED,
+            'damage' : ARROW_DAMAGE,
+            'state' : 'flight',
+        })
+
+def get_peak_rss_mb():
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak_rss / (1024 * 1024) if sys.platform == 'darwin' else peak_rss / 1024
+
+def get_percentile(sorted_values : list[float], percentile : float):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(percentile / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def run_scenario(name : str, duration : float = SCENARIO_DURATION, render : bool = False,
+                 trace_memory : bool = False, seed : int = 0, map_size : tuple[int, int] | None = None,
+                 waves : list[tuple[int, int]] | None = None, volley : tuple[int, int] | None = None):
+    # map_size, waves and volley override the preset's values when given.
+    scenario = dict(SCENARIOS[name])
+    if map_size is not None:
+        scenario['map_size'] = map_size
+    if waves is not None:
+        scenario['waves'] = waves
+    if volley is not None:
+        scenario['volley_interval'], scenario['volley_arrows'] = volley
+    rng = random.Random(seed)
+    original_tile_map = list(TILE_MAP)
+    load_tile_map(generate_tile_map(*scenario['map_size'], seed=seed))
+    try:
+        if trace_memory:
+            tracemalloc.start()
+        world = World()
+        player = world.add_player()
+        player.health = 10 ** 9
+        renderer = None
+        if render:
+            import pygame
+            from camera import Camera
+            from render import Renderer
+            pygame.init()
+            screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            camera = Camera(WIDTH, HEIGHT, len(TILE_MAP[0]) * TILE_SIZE, len(TILE_MAP) * TILE_SIZE)
+            renderer = Renderer(screen, camera)
+
+        frame_budget = 1 / FPS
+        frame_count = int(duration * FPS)
+        pending_waves = sorted(scenario['waves'])
+        next_volley_time = 0
+        frame_times = []
+        subsystem_totals = dict.fromkeys(SUBSYSTEMS, 0.0)
+        peak_enemies = peak_arrows = 0
+        # Simulated time advances by exactly one frame per tick so runs are repeatable.
+        for ind_frame in range(frame_count):
+            current_time = ind_frame * 1000 // FPS
+            while pending_waves and pending_waves[0][0] <= current_time:
+                spawn_wave(world, player.pos, pending_waves.pop(0)[1], rng)
+            if scenario['volley_arrows'] and current_time >= next_volley_time:
+                fire_volley(world, player.pos, scenario['volley_arrows'], rng)
+                next_volley_time += scenario['volley_interval']
+
+            input_state = get_scripted_input(current_time)
+            frame_start = time.perf_counter()
+            world.update({player : [input_state]}, current_time, subsystem_totals)
+            update_end = time.perf_counter()
+            world.process_events()
+            events_end = time.perf_counter()
+            if renderer is not None:
+                renderer.camera.update(player)
+                renderer.draw(world.all_sprites, world.projectiles)
+                pygame.display.flip()
+            frame_end = time.perf_counter()
+
+            subsystem_totals['events'] += events_end - update_end
+            subsystem_totals['render'] += frame_end - events_end
+            frame_times.append(frame_end - frame_start)
+            peak_enemies = max(peak_enemies, len(world.enemies_group))
+            peak_arrows = max(peak_arrows, len(world.projectiles))
+
+        sorted_frame_times = sorted(frame_times)
+        report = {
+            'name' : name,
+            'frames' : frame_count,
+            'peak_enemies' : peak_enemies,
+            'peak_arrows' : peak_arrows,
+            'p50_ms' : get_percentile(sorted_frame_times, 50) * 1000,
+            'p95_ms' : get_percentile(sorted_frame_times, 95) * 1000,
+            'p99_ms' : get_percentile(sorted_frame_times, 99) * 1000,
+            'max_ms' : sorted_frame_times[-1] * 1000 if sorted_frame_times else 0.0,
+            'budget_ms' : frame_budget * 1000,
+            'budget_misses' : sum(frame_time > frame_budget for frame_time in frame_times),
+            'subsystem_ms' : {subsystem : total / max(1, frame_count) * 1000 for subsystem, total in subsystem_totals.items()},
+            'peak_rss_mb' : get_peak_rss_mb(),
+            'peak_traced_mb' : tracemalloc.get_traced_memory()[1] / (1024 * 1024) if trace_memory else None,
+        }
+        return report
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        load_tile_map(original_tile_map)
+
+def parse_map_size(text : str):
+    try:
+        width_tiles, height_tiles = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT in tiles, got {text!r}")
+    # The border walls and the free 3x3 block around the spawn need 5x5 tiles.
+    if width_tiles < 5 or height_tiles < 5:
+        raise argparse.ArgumentTypeError("the map needs at least 5x5 tiles")
+    return width_tiles, height_tiles
+
+def parse_time_pair(text : str):
+    try:
+        first, second = (int(part) for part in text.split(':'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected two integers as A:B, got {text!r}")
+    if first < 0 or second < 0:
+        raise argparse.ArgumentTypeError(f"values must not be negative, got {text!r}")
+    return first, second
+
+def format_report(report : dict):
+    lines = [
+        f"{report['name']}: {report['frames']} frames, up to {report['peak_enemies']} enemies and {report['peak_arrows']} arrows",
+        f"  frame time p50 {report['p50_ms']:.2f} ms, p95 {report['p95_ms']:.2f} ms, "
+        f"p99 {report['p99_ms']:.2f} ms, max {report['max_ms']:.2f} ms",
+        f"  budget {report['budget_ms']:.2f} ms missed in {report['budget_misses']} frames "
+        f"({report['budget_misses'] / max(1, report['frames']):.1%})",
+        "  mean per frame: " + ", ".join(f"{subsystem} {mean_ms:.2f} ms" for subsystem, mean_ms in report['subsystem_ms'].items()),
+    ]
+    memory_parts = []
+    if report['peak_rss_mb'] is not None:
+        memory_parts.append(f"peak RSS {report['peak_rss_mb']:.1f} MB (scenario process)")
+    if report['peak_traced_mb'] is not None:
+        memory_parts.append(f"peak traced Python heap {report['peak_traced_mb']:.1f} MB")
+    if memory_parts:
+        lines.append("  " + ", ".join(memory_parts))
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run stress scenarios and report frame-time statistics.")
+    parser.add_argument('names', nargs='*', default=list(SCENARIOS), choices=list(SCENARIOS), metavar='SCENARIO',
+                        help=f"scenarios to run: {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument('--duration', type=float, default=SCENARIO_DURATION, help="simulated seconds per scenario")
+    parser.add_argument('--render', action='store_true', help="draw every frame as well")
+    parser.add_argument('--trace-memory', action='store_true', help="trace the Python heap (slows the simulation)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--map-size', type=parse_map_size, metavar='WxH', help="map size in tiles instead of the preset's")
+    parser.add_argument('--wave', type=parse_time_pair, action='append', dest='waves', metavar='T:N',
+                        help="spawn N enemies at T ms; repeat for several waves (replaces the preset's waves)")
+    parser.add_argument('--volley', type=parse_time_pair, metavar='INTERVAL:ARROWS',
+                        help="fire ARROWS arrows every INTERVAL ms instead of the preset's volleys (0 arrows disables)")
+    args = parser.parse_args()
+    # ru_maxrss never goes down, so each scenario runs in a fresh process to get its own peak.
+    spawn_context = multiprocessing.get_context('spawn')
+    for scenario_name in args.names:
+        with spawn_context.Pool(1) as pool:
+            report = pool.apply(run_scenario, (scenario_name, args.duration, args.render, args.trace_memory, args.seed,
+                                               args.map_size, args.waves, args.volley))
+        print(format_report(report))
\ No newline at end of file
@@ -0,0 +1,33 @@
+from geometry import Vector2
+from collections import defaultdict
+
+class SpatialHash:
+    def __init__(self, cell_size : int):
+        self.cell_size = cell_size
+        self.cells : defaultdict[tuple[int, int], list] = defaultdict(list)
+
+    def get_cell(self, pos : Vector2):
+        return (int(pos.x // self.cell_size), int(pos.y // self.cell_size))
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, obj, pos : Vector2):
+        self.cells[self.get_cell(pos)].append(obj)
+
+    def rebuild(self, objects):
+        self.cells.clear()
+        for obj in objects:
+            self.cells[self.get_cell(obj.pos)].append(obj)
+
+    def query(self, pos : Vector2, radius : float):
+        # Broad phase: every object in the cells overlapped by the query square.
+        min_cell_x, min_cell_y = int((pos.x - radius) // self.cell_size), int((pos.y - radius) // self.cell_size)
+        max_cell_x, max_cell_y = int((pos.x + radius) // self.cell_size), int((pos.y + radius) // self.cell_size)
+        found = []
+        for cell_x in range(min_cell_x, max_cell_x + 1):
+            for cell_y in range(min_cell_y, max_cell_y + 1):
+                cell = self.cells.get((cell_x, cell_y))
+                if cell:
+                    found.extend(cell)
+        return found
\ No newline at end of file
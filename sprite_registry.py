@@ -0,0 +1,31 @@
+import pygame
+
+_surfaces : dict[tuple, pygame.Surface] = {}
+
+def _prepare(surface : pygame.Surface):
+    if pygame.display.get_surface() is not None:
+        return surface.convert()
+    return surface
+
+def get_surface(width : int, height : int, color):
+    # One surface per archetype, shared by every sprite that looks the same.
+    key = (width, height, str(color))
+    surface = _surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface([width, height])
+        surface.fill(color)
+        surface = _prepare(surface)
+        _surfaces[key] = surface
+    return surface
+
+def get_rotated_surface(width : int, height : int, color, angle_degrees : float):
+    angle_degrees = round(angle_degrees) % 360
+    key = (width, height, str(color), angle_degrees)
+    surface = _surfaces.get(key)
+    if surface is None:
+        surface = pygame.transform.rotate(get_surface(width, height, color), angle_degrees)
+        _surfaces[key] = surface
+    return surface
+
+def clear():
+    _surfaces.clear()
\ No newline at end of file
@@ -1,10 +1,9 @@
-import pygame
 from collections import deque
-from pygame.math import Vector2
+from entity import Entity
 from typing import TypeVar, Generic, TYPE_CHECKING
-if TYPE_CHECKING: from .player import Player; from .arrow import Arrow; from .enemy import Enemy
+if TYPE_CHECKING: from .player import Player; from .enemy import Enemy
 
-ContextType = TypeVar('ContextType', bound=pygame.sprite.Sprite)
+ContextType = TypeVar('ContextType', bound=Entity)
 
 class State(Generic[ContextType]):
     def __init__(self, context : ContextType):
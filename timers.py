@@ -0,0 +1,39 @@
+import heapq
+import itertools
+from typing import Callable
+
+class Timer:
+    __slots__ = ('fire_time', 'callback', 'active')
+
+    def __init__(self, fire_time : int, callback : Callable[[int], None]):
+        self.fire_time = fire_time
+        self.callback = callback
+        self.active = True
+
+    def cancel(self):
+        self.active = False
+
+class TimerScheduler:
+    # Min-heap of expirations: a frame only touches the timers that are due,
+    # waiting cooldowns and durations cost nothing. Cancelled timers stay in
+    # the heap and are dropped when they reach the top.
+    def __init__(self):
+        self.heap : list[tuple[int, int, Timer]] = []
+        self._order = itertools.count()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def schedule(self, fire_time : int, callback : Callable[[int], None]):
+        timer = Timer(fire_time, callback)
+        heapq.heappush(self.heap, (fire_time, next(self._order), timer))
+        return timer
+
+    def advance(self, current_time : int):
+        # Callbacks get the time the timer was noticed, like the old per-frame checks;
+        # timers they schedule for the past fire in the same call.
+        while self.heap and self.heap[0][0] <= current_time:
+            timer = heapq.heappop(self.heap)[2]
+            if timer.active:
+                timer.active = False
+                timer.callback(current_time)
\ No newline at end of file
@@ -0,0 +1,141 @@
+import time
+from geometry import Vector2
+from entity import EntityGroup
+from collections import deque
+from player import Player
+from enemy import Enemy
+from projectiles import ProjectileSystem
+from world_objects import Wall
+from lod import AILevelOfDetail
+from spatial_hash import SpatialHash
+from timers import TimerScheduler
+from constants import *
+
+class World:
+    def __init__(self):
+        self.all_sprites = EntityGroup()
+        self.walls_group = EntityGroup()
+        self.enemies_group = EntityGroup()
+        self.players_group = EntityGroup()
+        self.timers = TimerScheduler()
+        
+        self.player_spawn_points : list[Vector2] = []
+        
+        for ind_row, tile_row in enumerate(TILE_MAP):
+            for ind_col, tile_char in enumerate(tile_row):
+                world_x = ind_col * TILE_SIZE
+                world_y = ind_row * TILE_SIZE
+                if tile_char == "W":
+                    wall = Wall(Vector2(world_x + TILE_SIZE / 2, world_y + TILE_SIZE / 2))
+                    self.all_sprites.add(wall)
+                    self.walls_group.add(wall)
+                elif tile_char == "E":
+                    self.spawn_enemy(Vector2(world_x + TILE_SIZE / 2, world_y + TILE_SIZE / 2))
+                elif tile_char == "P":
+                    self.player_spawn_points.append(Vector2(world_x + TILE_SIZE / 2, world_y + TILE_SIZE / 2))
+        if not self.player_spawn_points:
+            self.player_spawn_points.append(Vector2(80, 80))
+            
+        self.projectiles = ProjectileSystem()
+        self.ai_lod = AILevelOfDetail(ENEMY_LOD_TIERS, ENEMY_LOD_FAR_TICK_INTERVAL)
+        self.frame_index = 0
+        self.enemies_hash = SpatialHash(ENEMY_SEPARATION_DISTANCE)
+        self.game_events_queue = deque()
+        
+    def spawn_enemy(self, pos : Vector2):
+        enemy = Enemy(
+            pos, ENEMY_SPEED, ENEMY_HEALTH, ENEMY_SPRITE_WIDTH,
+            ENEMY_SPRITE_HEIGHT, SWORD_STRIKE_COOLDOWN, SWORD_STRIKE_DAMAGE, SWORD_STRIKE_RADIUS, SWORD_TIME_SWING,
+            SWORD_TIME_STRIKE, ENEMY_DETECTION_DISTANCE, self.all_sprites, None, self.timers
+        )
+        enemy.lod_phase = len(self.enemies_group)
+        if self.players_group:
+            enemy.player = enemy.sword_component.purpose_strike = self.players_group.sprites()[0]
+        self.all_sprites.add(enemy)
+        self.enemies_group.add(enemy)
+        return enemy
+        
+    def add_player(self):
+        # The last 'P' tile is the first player's spawn, further players cycle backwards.
+        spawn_point = self.player_spawn_points[-1 - len(self.players_group) % len(self.player_spawn_points)]
+        player = Player(
+            spawn_point.copy(), PLAYER_SPEED, WIDTH, HEIGHT, PLAYER_HEALTH, PLAYER_DASH_SPEED,
+            PLAYER_DASH_DURATION, PLAYER_DASH_COOLDOWN, PLAYER_MIN_TENSION_DURATION, PLAYER_MAX_TENSION_DURATION,
+            self.timers
+        )
+        self.all_sprites.add(player)
+        self.players_group.add(player)
+        for enemy in self.enemies_group:
+            if enemy.player is None or not enemy.player.alive():
+                enemy.player = enemy.sword_component.purpose_strike = player
+        return player
+    
+    def get_nearest_player(self, pos : Vector2):
+        nearest_player = None
+        nearest_distance_squared = float('inf')
+        for player in self.players_group:
+            distance_squared = pos.distance_squared_to(player.pos)
+            if distance_squared < nearest_distance_squared:
+                nearest_player = player
+                nearest_distance_squared = distance_squared
+        return nearest_player
+        
+    def update(self, inputs : dict[Player, list[dict]], current_time : int,
+               subsystem_times : dict[str, float] | None = None):
+        # subsystem_times, if given, accumulates the seconds spent in each step.
+        update_steps = (
+            ('timers', self.update_timers, (current_time,)),
+            ('players', self.update_players, (inputs, current_time)),
+            ('enemies', self.update_enemies, (current_time,)),
+            ('arrows', self.update_arrows, (current_time,)),
+        )
+        for subsystem, update_step, step_args in update_steps:
+            if subsystem_times is None:
+                update_step(*step_args)
+            else:
+                step_start = time.perf_counter()
+                update_step(*step_args)
+                subsystem_times[subsystem] = subsystem_times.get(subsystem, 0.0) + time.perf_counter() - step_start
+        self.frame_index += 1
+        
+    def update_timers(self, current_time : int):
+        self.timers.advance(current_time)
+        
+    def update_players(self, inputs : dict[Player, list[dict]], current_time : int):
+        # Each input state is one simulation step; a networked player can bring several per tick.
+        for player, input_states in inputs.items():
+            for input_state in input_states:
+                if player.alive():
+                    player.update(input_state, self.game_events_queue, current_time)
+                
+    def update_enemies(self, current_time : int):
+        self.enemies_hash.rebuild(self.enemies_group)
+        several_players = len(self.players_group) > 1
+        for enemy_sprite in self.enemies_group:
+            # Enemies whose target died or left pick the nearest living player, or none.
+            if several_players or enemy_sprite.player is None or not enemy_sprite.player.alive():
+                nearest_player = self.get_nearest_player(enemy_sprite.pos)
+                if nearest_player is not enemy_sprite.player:
+                    enemy_sprite.player = enemy_sprite.sword_component.purpose_strike = nearest_player
+            if enemy_sprite.player is None:
+                continue
+            step = self.ai_lod.get_step(enemy_sprite.pos, enemy_sprite.player.pos, enemy_sprite.lod_phase, self.frame_index)
+            if step:
+                enemy_sprite.update(self.game_events_queue, current_time, self.enemies_hash, step)
+                
+    def update_arrows(self, current_time : int):
+        self.projectiles.update(self.enemies_group, self.game_events_queue)
+        
+    def process_events(self):
+        arrow_shots = []
+        while self.game_events_queue:
+            event = self.game_events_queue.popleft()
+            if event['type'] == 'ARROW_SHOT':
+                arrow_shots.append(event)
+            if event['type'] == 'DEALING_DAMAGE':
+                for target in event['targets']:
+                    target.take_damage(event['amount_damage'])
+            if event['type'] == 'DEALING_DAMAGE_BATCH':
+                for target, amount_damage in zip(event['targets'], event['amounts_damage']):
+                    target.take_damage(amount_damage)
+        self.projectiles.spawn_many(arrow_shots)
\ No newline at end of file
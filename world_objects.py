@@ -1,12 +1,25 @@
-import pygame
-from pygame.math import Vector2
+from geometry import Vector2, Rect
+from entity import Entity
 from constants import *
 
-class Wall(pygame.sprite.Sprite):
+class Wall(Entity):
     def __init__(self, pos : Vector2):
         super().__init__()
-        self.image = pygame.Surface([TILE_SIZE, TILE_SIZE])
-        self.image.fill((100, 100, 100))
+        self.color = (100, 100, 100)
+        self.image_size = (TILE_SIZE, TILE_SIZE)
         self.pos = pos
-        self.rect = self.image.get_rect(center=pos)
-        
\ No newline at end of file
+        self.rect = Rect.from_center(pos, TILE_SIZE, TILE_SIZE)
+
+def get_wall_collisions(rect : Rect):
+    # Looks up only the tiles under the rect instead of testing every wall.
+    wall_rects = []
+    for row in range(max(0, rect.top // TILE_SIZE), min(len(TILE_MAP), (rect.bottom - 1) // TILE_SIZE + 1)):
+        tile_row = TILE_MAP[row]
+        for col in range(max(0, rect.left // TILE_SIZE), min(len(TILE_MAP[0]), (rect.right - 1) // TILE_SIZE + 1)):
+            if tile_row[col] == 'W':
+                wall_rects.append(Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+    return wall_rects
+
+def load_tile_map(tile_map : list[str]):
+    # Replaces the rows in place so every module holding TILE_MAP sees the new map.
+    TILE_MAP[:] = tile_map
\ No newline at end of file